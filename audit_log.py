@@ -0,0 +1,144 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import database
+
+logger = logging.getLogger(__name__)
+
+WRITE_ATTEMPTS = 3  # per batch, before its entries are logged and dropped
+WRITE_RETRY_DELAY = 0.5  # seconds; doubles after each failed attempt
+
+
+@dataclass(frozen=True)
+class AuditEntry:
+    """One recorded verification decision"""
+    guild_id: int
+    user_id: int
+    moderator_id: Optional[int]
+    action: str
+    created_at: float
+
+
+class AuditLog:
+    """Append-only audit trail of verification decisions.
+
+    Entries are indexed by user, moderator and time, so lookups stay fast
+    however large the history grows. record() only enqueues; a writer thread
+    with its own connection batches the inserts off the event loop.
+    """
+
+    def __init__(self, path=database.DB_PATH):
+        self.path = path
+        self.conn = database.connect(path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS verification_audit (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                moderator_id INTEGER,
+                action TEXT NOT NULL,
+                created_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_audit_user
+                ON verification_audit (guild_id, user_id, created_at);
+            CREATE INDEX IF NOT EXISTS idx_audit_moderator
+                ON verification_audit (guild_id, moderator_id, created_at);
+            CREATE INDEX IF NOT EXISTS idx_audit_time
+                ON verification_audit (guild_id, created_at);
+        """)
+        self._queue = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._write_loop,
+                                        name="audit-writer",
+                                        daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def record(self, action, guild_id, user_id, moderator_id=None):
+        """Queue a decision for writing; never blocks on disk"""
+        self._queue.put(
+            AuditEntry(guild_id=guild_id,
+                       user_id=user_id,
+                       moderator_id=moderator_id,
+                       action=action,
+                       created_at=time.time()))
+
+    def _write_loop(self):
+        conn = database.connect(self.path)
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                break
+            batch = [entry]
+            # Drain whatever else queued up so a burst is one transaction
+            while True:
+                try:
+                    entry = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if entry is None:
+                    self._queue.put(None)
+                    break
+                batch.append(entry)
+            self._write_batch(conn, batch)
+        conn.close()
+
+    def _write_batch(self, conn, batch):
+        """Insert a batch, retrying failures so one bad write can't kill the writer"""
+        delay = WRITE_RETRY_DELAY
+        for attempt in range(1, WRITE_ATTEMPTS + 1):
+            try:
+                conn.executemany(
+                    "INSERT INTO verification_audit "
+                    "(guild_id, user_id, moderator_id, action, created_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [(e.guild_id, e.user_id, e.moderator_id, e.action,
+                      e.created_at) for e in batch])
+                conn.commit()
+                return
+            except Exception as e:
+                logger.error(
+                    f"Audit log write of {len(batch)} entries failed "
+                    f"(attempt {attempt}/{WRITE_ATTEMPTS}): {e}")
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
+            if attempt < WRITE_ATTEMPTS:
+                time.sleep(delay)
+                delay *= 2
+        logger.error(f"Dropped {len(batch)} audit log entries: {batch}")
+
+    def close(self):
+        """Flush queued entries and stop the writer thread"""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+
+    def query(self, guild_id, user_id=None, moderator_id=None, limit=10):
+        """Most recent decisions in a guild, optionally for a user/moderator"""
+        clauses = ["guild_id = ?"]
+        params = [guild_id]
+        if user_id is not None:
+            clauses.append("user_id = ?")
+            params.append(user_id)
+        if moderator_id is not None:
+            clauses.append("moderator_id = ?")
+            params.append(moderator_id)
+        rows = self.conn.execute(
+            "SELECT guild_id, user_id, moderator_id, action, created_at "
+            f"FROM verification_audit WHERE {' AND '.join(clauses)} "
+            "ORDER BY created_at DESC LIMIT ?", (*params, limit)).fetchall()
+        return [AuditEntry(**dict(row)) for row in rows]
+
+    def outcome_counts(self, guild_id, user_id):
+        """{action: count} of past decisions about a user in a guild"""
+        rows = self.conn.execute(
+            "SELECT action, COUNT(*) AS count FROM verification_audit "
+            "WHERE guild_id = ? AND user_id = ? GROUP BY action",
+            (guild_id, user_id)).fetchall()
+        return {row['action']: row['count'] for row in rows}
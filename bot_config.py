@@ -0,0 +1,131 @@
+import json
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+# config.json ships with values like REPLACE_WITH_YOUR_REVIEW_CHANNEL_ID
+PLACEHOLDER_PREFIX = "REPLACE_WITH_"
+
+REQUIRED_KEYS = ['min_account_age_days', 'review_channel_id', 'verified_role_id']
+
+# message: one review message per request; queue: a single paginated message
+REVIEW_MODES = ('message', 'queue')
+
+# dm: one DM prompt per question; modal: one form from the verify button
+QUESTIONNAIRE_MODES = ('dm', 'modal')
+
+
+class ConfigError(Exception):
+    """config.json is missing, unreadable or invalid"""
+
+
+def extract_id(id_string):
+    """Extract ID from mention format or return as-is if already an ID"""
+    if isinstance(id_string, str):
+        # Remove role mention format <@&123456789> -> 123456789
+        if id_string.startswith('<@&') and id_string.endswith('>'):
+            return id_string[3:-1]
+        # Remove channel mention format <#123456789> -> 123456789
+        elif id_string.startswith('<#') and id_string.endswith('>'):
+            return id_string[2:-1]
+        # Remove user mention format <@123456789> -> 123456789
+        elif id_string.startswith('<@') and id_string.endswith('>'):
+            return id_string[2:-1]
+    return str(id_string)
+
+
+def parse_snowflake(value, key):
+    """Parse a configured ID; None if it is still a placeholder"""
+    if isinstance(value, str) and value.startswith(PLACEHOLDER_PREFIX):
+        return None
+    clean_id = extract_id(value)
+    if not clean_id.isdigit():
+        raise ConfigError(f"{key} must be a Discord ID or mention, got {value!r}")
+    return int(clean_id)
+
+
+@dataclass(frozen=True)
+class BotConfig:
+    """config.json, validated and parsed once at load time"""
+    min_account_age_days: int
+    review_channel_id: Optional[int]
+    verified_role_id: Optional[int]
+    review_mode: str = 'message'
+    questionnaire_mode: str = 'dm'
+    max_concurrent_sessions: int = 500
+
+    @classmethod
+    def from_dict(cls, data):
+        missing_keys = [key for key in REQUIRED_KEYS if key not in data]
+        if missing_keys:
+            raise ConfigError(
+                f"Missing required configuration keys: {missing_keys}")
+
+        min_age = data['min_account_age_days']
+        if isinstance(min_age, bool) or not isinstance(min_age, int) or min_age < 0:
+            raise ConfigError(
+                f"min_account_age_days must be a non-negative integer, got {min_age!r}")
+
+        review_mode = data.get('review_mode', 'message')
+        if review_mode not in REVIEW_MODES:
+            raise ConfigError(
+                f"review_mode must be one of {list(REVIEW_MODES)}, got {review_mode!r}")
+
+        questionnaire_mode = data.get('questionnaire_mode', 'dm')
+        if questionnaire_mode not in QUESTIONNAIRE_MODES:
+            raise ConfigError(
+                f"questionnaire_mode must be one of {list(QUESTIONNAIRE_MODES)}, "
+                f"got {questionnaire_mode!r}")
+
+        max_sessions = data.get('max_concurrent_sessions', 500)
+        if isinstance(max_sessions, bool) or not isinstance(max_sessions, int) or max_sessions < 1:
+            raise ConfigError(
+                f"max_concurrent_sessions must be a positive integer, got {max_sessions!r}")
+
+        return cls(min_account_age_days=min_age,
+                   review_channel_id=parse_snowflake(
+                       data['review_channel_id'], 'review_channel_id'),
+                   verified_role_id=parse_snowflake(data['verified_role_id'],
+                                                    'verified_role_id'),
+                   review_mode=review_mode,
+                   questionnaire_mode=questionnaire_mode,
+                   max_concurrent_sessions=max_sessions)
+
+
+def load_config(path):
+    """Read and validate a config file"""
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        raise ConfigError(
+            f"{path} file not found. Please create it with the required settings.")
+    except json.JSONDecodeError as e:
+        raise ConfigError(f"Error parsing {path}: {e}")
+    return BotConfig.from_dict(data)
+
+
+class ConfigWatcher:
+    """Reload a config file when its modification time changes"""
+
+    def __init__(self, path):
+        self.path = path
+        self._mtime = self._stat()
+
+    def _stat(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def poll(self):
+        """Return a freshly loaded BotConfig if the file changed, else None.
+
+        Raises ConfigError if the changed file is invalid; the change is
+        still recorded so a bad edit is reported once, not on every poll.
+        """
+        mtime = self._stat()
+        if mtime is None or mtime == self._mtime:
+            return None
+        self._mtime = mtime
+        return load_config(self.path)
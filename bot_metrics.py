@@ -0,0 +1,123 @@
+import asyncio
+import functools
+import logging
+import time
+
+import discord
+
+import metrics
+
+INTERACTIONS = metrics.counter('discord_interactions_total',
+                               'Component interactions by custom_id namespace',
+                               ['namespace'])
+STAGE_SECONDS = metrics.histogram(
+    'verification_stage_seconds',
+    'Time applicants take to answer each verification step', ['stage'],
+    buckets=(5, 15, 30, 60, 120, 180, 300, 600))
+SESSION_TIMEOUTS = metrics.counter(
+    'verification_timeouts_total',
+    'Verification sessions that expired, by the step they were on', ['stage'])
+REST_SECONDS = metrics.histogram(
+    'discord_rest_seconds',
+    'Discord REST request latency, including rate-limit waits', ['route'])
+REST_ERRORS = metrics.counter('discord_rest_errors_total',
+                              'Discord REST requests that failed',
+                              ['route', 'status'])
+RATE_LIMITS = metrics.counter('discord_rate_limits_total',
+                              '429 responses from the Discord API', ['scope'])
+LOOP_LAG_SECONDS = metrics.histogram(
+    'event_loop_lag_seconds',
+    'How late the event loop woke a sleeping task',
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0))
+
+
+def instrument_http(http):
+    """Time every REST call made through a discord.py HTTPClient"""
+    request = http.request
+
+    @functools.wraps(request)
+    async def timed_request(route, **kwargs):
+        # The path template keeps the label set small (no snowflakes)
+        label = f"{route.method} {route.path}"
+        started = time.perf_counter()
+        try:
+            return await request(route, **kwargs)
+        except discord.HTTPException as e:
+            REST_ERRORS.inc(route=label, status=e.status)
+            raise
+        finally:
+            REST_SECONDS.observe(time.perf_counter() - started, route=label)
+
+    http.request = timed_request
+
+
+class _RateLimitFilter(logging.Filter):
+    """Count the 429s discord.py reports; records pass through unchanged
+
+    Every 429 is logged as "We are being rate limited", and a global one is
+    followed by "Global rate limit has been hit" with no await in between.
+    So the route count waits one loop iteration and is cancelled if the
+    global line comes first, instead of counting a global 429 twice.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._pending_route = None
+
+    def filter(self, record):
+        if isinstance(record.msg, str):
+            if record.msg.startswith('Global rate limit has been hit'):
+                if self._pending_route is not None:
+                    self._pending_route.cancel()
+                    self._pending_route = None
+                RATE_LIMITS.inc(scope='global')
+            elif record.msg.startswith('We are being rate limited'):
+                try:
+                    loop = asyncio.get_running_loop()
+                except RuntimeError:
+                    RATE_LIMITS.inc(scope='route')
+                else:
+                    self._pending_route = loop.call_soon(self._count_route)
+        return True
+
+    def _count_route(self):
+        self._pending_route = None
+        RATE_LIMITS.inc(scope='route')
+
+
+def count_rate_limits():
+    """discord.py has no rate-limit event, only these log lines"""
+    logging.getLogger('discord.http').addFilter(_RateLimitFilter())
+
+
+class LoopLagMonitor:
+    """Measure how late the event loop wakes a sleeping task.
+
+    last_tick is also read from other threads (the health endpoint), which
+    is how a loop that has stopped running entirely is noticed.
+    """
+
+    def __init__(self, interval=0.5):
+        self.interval = interval
+        self.lag = 0.0
+        self.last_tick = None
+        self._task = None
+
+    def stalled_for(self):
+        """Seconds the loop is overdue for its next tick (0 if on time)"""
+        if self.last_tick is None:
+            return 0.0
+        return max(0.0, time.monotonic() - self.last_tick - self.interval)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.lag = max(0.0, loop.time() - expected)
+            self.last_tick = time.monotonic()
+            LOOP_LAG_SECONDS.observe(self.lag)
@@ -0,0 +1,69 @@
+import hashlib
+import json
+import logging
+import time
+
+import database
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_SCOPE = 0  # scope key for global commands; guild scopes use the guild id
+
+
+def tree_hash(tree, guild=None):
+    """SHA-256 of the payload tree.sync(guild=guild) would upload"""
+    payload = sorted((command.to_dict(tree)
+                      for command in tree.get_commands(guild=guild)),
+                     key=lambda command: (command['type'], command['name']))
+    encoded = json.dumps(payload, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class CommandSync:
+    """Sync a command tree only when it changed since the last sync.
+
+    The hash of the last uploaded payload is kept per application and scope
+    (global or one guild). A restart or reconnect with unchanged commands
+    then skips the rate-limited bulk upsert entirely.
+    """
+
+    def __init__(self, tree, path=database.DB_PATH):
+        self.tree = tree
+        self.conn = database.connect(path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS command_sync (
+                application_id INTEGER NOT NULL,
+                scope INTEGER NOT NULL,
+                hash TEXT NOT NULL,
+                synced_at REAL NOT NULL,
+                PRIMARY KEY (application_id, scope)
+            )
+        """)
+        self.conn.commit()
+
+    def _scope(self, guild):
+        return GLOBAL_SCOPE if guild is None else guild.id
+
+    def synced_hash(self, guild=None):
+        """Hash of the last payload synced to this scope, or None"""
+        row = self.conn.execute(
+            "SELECT hash FROM command_sync WHERE application_id = ? AND scope = ?",
+            (self.tree.client.application_id, self._scope(guild))).fetchone()
+        return row['hash'] if row else None
+
+    async def sync(self, guild=None, force=False):
+        """Sync one scope if its commands changed; None if it was skipped"""
+        scope_name = "globally" if guild is None else f"to guild {guild.id}"
+        digest = tree_hash(self.tree, guild)
+        if not force and self.synced_hash(guild) == digest:
+            logger.info(f"Slash commands unchanged, skipped syncing {scope_name}")
+            return None
+
+        synced = await self.tree.sync(guild=guild)
+        self.conn.execute(
+            "INSERT OR REPLACE INTO command_sync VALUES (?, ?, ?, ?)",
+            (self.tree.client.application_id, self._scope(guild), digest,
+             time.time()))
+        self.conn.commit()
+        logger.info(f"Synced {len(synced)} slash commands {scope_name}")
+        return synced
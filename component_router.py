@@ -0,0 +1,215 @@
+import logging
+import re
+import time
+
+import discord
+
+from bot_metrics import INTERACTIONS
+from deferral import respond
+
+logger = logging.getLogger(__name__)
+
+
+class MalformedCustomId(ValueError):
+    """A custom_id matched a registered namespace but its payload is invalid"""
+
+
+def snowflake(raw):
+    """Parse a Discord snowflake payload"""
+    if not raw.isdigit() or len(raw) > 20:
+        raise ValueError(f"not a snowflake: {raw!r}")
+    return int(raw)
+
+
+def page_number(raw):
+    """Parse a non-negative page/position payload"""
+    if not raw.isdigit() or len(raw) > 9:
+        raise ValueError(f"not a page number: {raw!r}")
+    return int(raw)
+
+
+class ComponentRoutes:
+    """The component handlers one extension declares.
+
+    The table lives in the extension's module and is only handed to the
+    router when its cog loads, so if a reload fails and discord.py rolls
+    back to the old module, the old module's setup() registers the old
+    routes again.
+    """
+
+    def __init__(self):
+        self.routes = []  # (namespace, handler, payload parser)
+
+    def component(self, namespace, payload=None):
+        """Decorator declaring a handler(interaction[, parsed_payload])"""
+
+        def decorator(handler):
+            self.routes.append((namespace, handler, payload))
+            return handler
+
+        return decorator
+
+
+class ComponentRouter:
+    """Persistent buttons whose custom_ids are matched by the library.
+
+    A custom_id is either a static id (``nsfw_verify_button``) or
+    ``<namespace>:<payload>`` (``approve:1234``). Each registered namespace
+    becomes a discord.ui.DynamicItem with a template for its ids. Once the
+    items are added with ``bot.add_dynamic_items()`` (each extension adds
+    the items for its ComponentRoutes when its cog loads), buttons on
+    messages sent before a restart dispatch like new ones, and payloads are
+    parsed before the handler makes any API call.
+    """
+
+    SEPARATOR = ':'
+    # Review messages posted before the switch to ':' use approve_<id>
+    LEGACY_SEPARATOR = '_'
+
+    def __init__(self, profiler=None):
+        self.profiler = profiler
+        self._items = {}
+
+    @property
+    def items(self):
+        """The DynamicItem classes to register with the bot"""
+        return tuple(self._items.values())
+
+    def register(self, namespace, handler, payload=None):
+        """Route ``namespace`` to handler(interaction[, parsed_payload])
+
+        ``payload`` parses the part after the separator; leave it None for
+        static ids that carry no payload.
+        """
+        self._items[namespace] = self._item_class(namespace, handler, payload)
+
+    def add_routes(self, routes):
+        """Register a ComponentRoutes table; returns its item classes"""
+        for namespace, handler, payload in routes.routes:
+            self.register(namespace, handler, payload)
+        return tuple(self._items[namespace] for namespace, _, _ in routes.routes)
+
+    def remove_routes(self, routes):
+        """Drop a ComponentRoutes table's namespaces; returns their item classes"""
+        return tuple(self._items.pop(namespace)
+                     for namespace, _, _ in routes.routes
+                     if namespace in self._items)
+
+    @classmethod
+    def build(cls, namespace, payload):
+        """Build a custom_id for a namespaced component"""
+        return f"{namespace}{cls.SEPARATOR}{payload}"
+
+    def button(self, namespace, payload=None, **kwargs):
+        """A persistent button for a registered namespace.
+
+        Keyword arguments (label, style, disabled...) go to discord.ui.Button.
+        """
+        custom_id = namespace if payload is None else self.build(
+            namespace, payload)
+        return self._items[namespace](discord.ui.Button(custom_id=custom_id,
+                                                        **kwargs))
+
+    def _item_class(self, namespace, handler, parse):
+        router = self
+        template = re.escape(namespace)
+        if parse is not None:
+            template += (f"[{re.escape(self.SEPARATOR)}"
+                         f"{re.escape(self.LEGACY_SEPARATOR)}](?P<payload>.+)")
+
+        class RoutedButton(discord.ui.DynamicItem[discord.ui.Button],
+                           template=template):
+
+            def __init__(self, item, args=()):
+                super().__init__(item)
+                self.args = args
+
+            @classmethod
+            async def from_custom_id(cls, interaction, item, match):
+                if parse is None:
+                    return cls(item)
+                try:
+                    return cls(item, (parse(match['payload']), ))
+                except ValueError as e:
+                    raise MalformedCustomId(f"{item.custom_id!r}: {e}") from e
+
+            async def callback(self, interaction):
+                await router.run(namespace, handler, interaction, self.args)
+
+        RoutedButton.__name__ = RoutedButton.__qualname__ = (
+            f"RoutedButton[{namespace}]")
+        return RoutedButton
+
+    async def run(self, namespace, handler, interaction, args):
+        """Call a handler, counting and timing it and reporting failures"""
+        INTERACTIONS.inc(namespace=namespace)
+        started = time.perf_counter()
+        try:
+            await handler(interaction, *args)
+        except Exception as e:
+            logger.error(
+                f"Error handling interaction {interaction.data.get('custom_id')}: {e}")
+            try:
+                await respond(
+                    interaction,
+                    "An error occurred while processing your request. Please try again later.",
+                    ephemeral=True)
+            except discord.HTTPException:
+                pass
+        finally:
+            if self.profiler is not None:
+                self.profiler.observe(f"component:{namespace}",
+                                      time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    # Benchmark: matching a custom_id against the registered templates (as
+    # discord.py does for every component interaction) versus the
+    # ==/startswith chain on_interaction used, as the number of buttons grows.
+    import timeit
+
+    async def handler(interaction, *args):
+        pass
+
+    def chain_resolver(namespaces):
+        def resolve(custom_id):
+            if custom_id == "nsfw_verify_button":
+                return handler, ()
+            for namespace in namespaces:
+                if custom_id.startswith(namespace + "_"):
+                    return handler, (int(custom_id.split("_")[1]), )
+            return None
+
+        return resolve
+
+    def template_resolver(router):
+        patterns = [(item.__discord_ui_compiled_template__, item)
+                    for item in router.items]
+
+        def resolve(custom_id):
+            for pattern, item in patterns:
+                match = pattern.fullmatch(custom_id)
+                if match is not None:
+                    return item, match
+
+        return resolve
+
+    print(f"{'buttons':>8} {'chain':>10} {'templates':>10}")
+    for extra in (0, 10, 100):
+        namespaces = ["approve", "reject"] + [f"button{i}" for i in range(extra)]
+        router = ComponentRouter()
+        router.register("nsfw_verify_button", handler)
+        for namespace in namespaces:
+            router.register(namespace, handler, snowflake)
+
+        # Worst case for both: the last registered namespace
+        last = namespaces[-1]
+        chain = chain_resolver(namespaces)
+        templates = template_resolver(router)
+        chained = timeit.timeit(lambda: chain(f"{last}_636731375831220234"),
+                                number=100_000) / 100_000
+        matched = timeit.timeit(
+            lambda: templates(f"{last}:636731375831220234"),
+            number=100_000) / 100_000
+        print(f"{len(namespaces) + 1:>8} {chained * 1e9:>7.0f} ns "
+              f"{matched * 1e9:>7.0f} ns")
@@ -0,0 +1,24 @@
+import os
+import sqlite3
+
+# Path of the local SQLite database shared by the bot's persistent stores
+DB_PATH = os.environ.get('BOT_DB_PATH', 'bot.db')
+
+
+def connect(path=DB_PATH):
+    """Open a SQLite connection tuned for many small keyed reads/writes"""
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    # WAL lets readers proceed while a write is in flight and keeps commits cheap
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def ensure_columns(conn, table, columns):
+    """Add columns introduced after a table was first created"""
+    existing = {row['name'] for row in conn.execute(f"PRAGMA table_info({table})")}
+    for name, definition in columns.items():
+        if name not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
+    conn.commit()
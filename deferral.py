@@ -0,0 +1,128 @@
+import asyncio
+import functools
+import logging
+
+import discord
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+# Discord fails an interaction that isn't acknowledged within 3 seconds
+DEFER_BUDGET = 2.0
+
+# How a late handler is acknowledged
+DEFER_UPDATE = 'update'  # silently; the handler edits the message clicked
+DEFER_REPLY = 'reply'  # "thinking..." until the handler's ephemeral reply
+
+GUARDED = metrics.counter(
+    'interaction_defer_guarded_total',
+    'Interactions run with an automatic deferral budget', ['handler'])
+DEFERRALS = metrics.counter(
+    'interaction_deferrals_total',
+    'Interactions deferred because the handler ran past its budget',
+    ['handler'])
+DEFER_FAILURES = metrics.counter(
+    'interaction_defer_failures_total',
+    'Automatic deferrals Discord refused, usually because the interaction had expired',
+    ['handler'])
+
+_LOCK = 'response_lock'
+
+
+def _response_lock(interaction):
+    # Unguarded interactions get a throwaway lock; nothing races them
+    return interaction.extras.get(_LOCK) or asyncio.Lock()
+
+
+class AutoDefer:
+    """Defer an interaction if its handler hasn't responded within ``budget``.
+
+    ``async with AutoDefer(interaction, DEFER_UPDATE):`` around a handler
+    that answers through respond(), edit_message() and send_modal(), which
+    pick the initial response or the followup depending on whether the
+    deferral fired. They share a lock with the deferral, so the two never
+    both try to send the initial response.
+    """
+
+    def __init__(self, interaction, mode=DEFER_REPLY, budget=DEFER_BUDGET,
+                 name='unknown'):
+        self.interaction = interaction
+        self.mode = mode
+        self.budget = budget
+        self.name = name
+        self._task = None
+        self._deferring = False
+
+    async def __aenter__(self):
+        self.interaction.extras[_LOCK] = asyncio.Lock()
+        GUARDED.inc(handler=self.name)
+        self._task = asyncio.create_task(self._defer_later())
+        return self
+
+    async def __aexit__(self, *exc_info):
+        if self._deferring:
+            # Let an in-flight defer finish rather than cut the request off
+            await self._task
+        else:
+            self._task.cancel()
+
+    async def _defer_later(self):
+        await asyncio.sleep(self.budget)
+        response = self.interaction.response
+        async with self.interaction.extras[_LOCK]:
+            if response.is_done():
+                return
+            self._deferring = True
+            DEFERRALS.inc(handler=self.name)
+            logger.info(f"Deferring {self.name}: no response after {self.budget}s")
+            try:
+                if self.mode == DEFER_UPDATE:
+                    await response.defer()
+                else:
+                    await response.defer(ephemeral=True, thinking=True)
+            except discord.HTTPException as e:
+                DEFER_FAILURES.inc(handler=self.name)
+                logger.error(f"Could not defer {self.name}: {e}")
+
+
+def auto_defer(mode=DEFER_REPLY, budget=DEFER_BUDGET):
+    """Decorator running a handler(interaction, ...) under AutoDefer"""
+
+    def decorator(handler):
+        @functools.wraps(handler)
+        async def wrapper(interaction, *args, **kwargs):
+            async with AutoDefer(interaction, mode, budget, handler.__name__):
+                return await handler(interaction, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+async def respond(interaction, *args, **kwargs):
+    """Send a message, as a followup if the interaction was already answered"""
+    async with _response_lock(interaction):
+        if interaction.response.is_done():
+            return await interaction.followup.send(*args, **kwargs)
+        return await interaction.response.send_message(*args, **kwargs)
+
+
+async def edit_message(interaction, **kwargs):
+    """Edit the message a component is attached to, deferred or not"""
+    async with _response_lock(interaction):
+        response = interaction.response
+        if not response.is_done():
+            return await response.edit_message(**kwargs)
+        if response.type == discord.InteractionResponseType.deferred_message_update:
+            return await interaction.edit_original_response(**kwargs)
+        return await interaction.message.edit(**kwargs)
+
+
+async def send_modal(interaction, modal):
+    """Open a modal; False if the interaction was already deferred or answered"""
+    async with _response_lock(interaction):
+        if interaction.response.is_done():
+            return False
+        await interaction.response.send_modal(modal)
+        return True
@@ -0,0 +1,233 @@
+import asyncio
+import itertools
+import logging
+import time
+from collections import OrderedDict, deque
+
+import discord
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+# Priority lanes, lowest number sent first
+PRIORITY_MODERATION = 0  # approval/rejection results
+PRIORITY_QUESTIONNAIRE = 1  # prompts the applicant has to act on
+PRIORITY_CHATTER = 2  # confirmations like "Answer recorded."
+
+PRIORITY_NAMES = {
+    PRIORITY_MODERATION: 'moderation',
+    PRIORITY_QUESTIONNAIRE: 'questionnaire',
+    PRIORITY_CHATTER: 'chatter',
+}
+
+DM_QUEUE_DEPTH = metrics.gauge('dm_outbox_queue_depth',
+                               'DM channels with messages waiting to be sent')
+DM_WAIT_SECONDS = metrics.histogram('dm_outbox_wait_seconds',
+                                    'Time a DM waited in the outbox before sending',
+                                    ['priority'])
+DM_SENT = metrics.counter('dm_outbox_sent_total', 'DMs sent by the outbox',
+                          ['priority'])
+DM_COALESCED = metrics.counter(
+    'dm_outbox_coalesced_total',
+    'Messages merged into an already queued DM to the same user')
+DM_FAILED = metrics.counter('dm_outbox_failed_total',
+                            'DMs that could not be delivered', ['reason'])
+
+
+class TokenBucket:
+    """Classic token bucket: ``rate`` tokens per second, up to ``capacity``"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def take(self):
+        """Consume a token; returns 0, or seconds to wait until one is free"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity,
+                          self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) / self.rate
+
+
+class _Batch:
+    """Messages for one user that will go out as a single DM"""
+
+    def __init__(self, priority):
+        self.priority = priority
+        self.parts = []
+        self.futures = []
+        self.length = 0
+        self.enqueued_at = time.monotonic()
+
+
+class _Recipient:
+    """A user's unsent batches, oldest first"""
+
+    def __init__(self, user):
+        self.user = user
+        self.batches = deque()
+
+    @property
+    def priority(self):
+        # Earlier batches must go first, so the most urgent one sets the lane
+        return min(batch.priority for batch in self.batches)
+
+
+class DMScheduler:
+    """Central outbox for direct messages.
+
+    Messages queued for the same user while an earlier one is still waiting
+    are coalesced into a single send. Recipients are served in priority order
+    (moderator decisions first, confirmation chatter last), each DM channel
+    has its own token bucket, and a global bucket keeps the total under the
+    bot-wide limit. Messages to one user are always delivered in order.
+    """
+
+    MAX_MESSAGE_LENGTH = 2000
+
+    def __init__(self,
+                 workers=4,
+                 per_user_rate=1.0,
+                 per_user_burst=5,
+                 global_rate=40.0,
+                 max_tracked_users=10000):
+        self.worker_count = workers
+        self.per_user_rate = per_user_rate
+        self.per_user_burst = per_user_burst
+        self.max_tracked_users = max_tracked_users
+        self._global_bucket = TokenBucket(global_rate, global_rate)
+        self._user_buckets = OrderedDict()
+        self._pending = {}
+        self._in_flight = set()
+        self._ready = None
+        self._workers = []
+        self._sequence = itertools.count()
+        DM_QUEUE_DEPTH.set_function(lambda: len(self._pending))
+
+    def __len__(self):
+        return len(self._pending)
+
+    def send(self, user, content, priority=PRIORITY_QUESTIONNAIRE):
+        """Queue a DM; await the result for the sent Message.
+
+        Raises discord.Forbidden/HTTPException if it could not be delivered.
+        """
+        return self._enqueue(user, content, priority)
+
+    def post(self, user, content, priority=PRIORITY_CHATTER):
+        """Queue a DM without waiting; delivery failures are logged"""
+        future = self._enqueue(user, content, priority)
+        future.add_done_callback(self._log_failure)
+
+    @staticmethod
+    def _log_failure(future):
+        if not future.cancelled() and future.exception() is not None:
+            logger.info(f"Could not deliver queued DM: {future.exception()}")
+
+    def _enqueue(self, user, content, priority):
+        if self._ready is None:
+            self._start()
+        future = asyncio.get_running_loop().create_future()
+
+        recipient = self._pending.get(user.id)
+        if recipient is None:
+            recipient = self._pending[user.id] = _Recipient(user)
+        previous_priority = recipient.priority if recipient.batches else None
+
+        batch = recipient.batches[-1] if recipient.batches else None
+        if batch is not None and batch.length + 2 + len(
+                content) <= self.MAX_MESSAGE_LENGTH:
+            DM_COALESCED.inc()
+            batch.priority = min(batch.priority, priority)
+        else:
+            batch = _Batch(priority)
+            recipient.batches.append(batch)
+        batch.parts.append(content)
+        batch.futures.append(future)
+        batch.length += len(content) + 2
+
+        if previous_priority is None or recipient.priority < previous_priority:
+            self._schedule(user.id, recipient.priority)
+        return future
+
+    def _schedule(self, user_id, priority):
+        self._ready.put_nowait((priority, next(self._sequence), user_id))
+
+    def _start(self):
+        self._ready = asyncio.PriorityQueue()
+        self._workers = [
+            asyncio.create_task(self._work()) for _ in range(self.worker_count)
+        ]
+
+    def _user_bucket(self, user_id):
+        bucket = self._user_buckets.get(user_id)
+        if bucket is None:
+            bucket = self._user_buckets[user_id] = TokenBucket(
+                self.per_user_rate, self.per_user_burst)
+            if len(self._user_buckets) > self.max_tracked_users:
+                self._user_buckets.popitem(last=False)
+        else:
+            self._user_buckets.move_to_end(user_id)
+        return bucket
+
+    async def _work(self):
+        while True:
+            priority, _, user_id = await self._ready.get()
+            recipient = self._pending.get(user_id)
+            # Stale entry: already sent, or re-queued in a more urgent lane
+            if recipient is None or priority != recipient.priority:
+                continue
+            # Keep per-user ordering: the next batch waits for the current send
+            if user_id in self._in_flight:
+                continue
+
+            wait = self._user_bucket(user_id).take()
+            if wait:
+                asyncio.get_running_loop().call_later(wait, self._schedule,
+                                                      user_id, priority)
+                continue
+
+            self._in_flight.add(user_id)
+            try:
+                wait = self._global_bucket.take()
+                while wait:
+                    await asyncio.sleep(wait)
+                    wait = self._global_bucket.take()
+
+                batch = recipient.batches.popleft()
+                if not recipient.batches:
+                    del self._pending[user_id]
+                await self._deliver(recipient.user, batch)
+            finally:
+                self._in_flight.discard(user_id)
+                if user_id in self._pending:
+                    self._schedule(user_id, self._pending[user_id].priority)
+
+    async def _deliver(self, user, batch):
+        DM_WAIT_SECONDS.observe(time.monotonic() - batch.enqueued_at,
+                                priority=PRIORITY_NAMES[batch.priority])
+        try:
+            message = await user.send("\n\n".join(batch.parts))
+        except Exception as e:
+            if isinstance(e, discord.Forbidden):
+                DM_FAILED.inc(reason='forbidden')
+            elif isinstance(e, discord.HTTPException):
+                DM_FAILED.inc(reason='http')
+            else:
+                DM_FAILED.inc(reason='error')
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        DM_SENT.inc(priority=PRIORITY_NAMES[batch.priority])
+        for future in batch.futures:
+            if not future.done():
+                future.set_result(message)
@@ -0,0 +1,74 @@
+class DMRouter:
+    """Route direct messages to the handler waiting on (user_id, channel_id).
+
+    Replaces one wait_for predicate per pending session: guild traffic is
+    dropped on a single attribute check and DMs cost one dict lookup no matter
+    how many sessions are waiting.
+    """
+
+    def __init__(self):
+        self._routes = {}
+
+    def __len__(self):
+        return len(self._routes)
+
+    def register(self, user_id, channel_id, handler):
+        """Send future DMs from user_id in channel_id to handler(message)"""
+        self._routes[(user_id, channel_id)] = handler
+
+    def unregister(self, user_id, channel_id):
+        """Stop routing DMs for this user/channel pair"""
+        self._routes.pop((user_id, channel_id), None)
+
+    def route(self, message):
+        """Return the handler for a message, or None if nothing is waiting"""
+        if message.guild is not None:
+            return None
+        return self._routes.get((message.author.id, message.channel.id))
+
+    async def dispatch(self, message):
+        """Run the waiting handler for a message; returns True if one ran"""
+        handler = self.route(message)
+        if handler is None:
+            return False
+        await handler(message)
+        return True
+
+
+if __name__ == "__main__":
+    # Benchmark: per-message dispatch cost versus one wait_for predicate per
+    # pending session, which is what discord.py evaluates for every message.
+    import timeit
+    from types import SimpleNamespace
+
+    def make_message(user_id, guild=None):
+        return SimpleNamespace(author=SimpleNamespace(id=user_id),
+                               channel=SimpleNamespace(id=user_id + 1),
+                               guild=guild,
+                               content="yes")
+
+    async def handler(message):
+        pass
+
+    print(f"{'pending':>8} {'wait_for scan':>15} {'router DM':>12} {'router guild':>14}")
+    for pending in (10, 1_000, 10_000):
+        router = DMRouter()
+        predicates = []
+        for user_id in range(pending):
+            router.register(user_id, user_id + 1, handler)
+            predicates.append(
+                lambda m, uid=user_id: (m.author.id == uid and m.guild is None
+                                        and len(m.content.strip()) > 0))
+
+        dm = make_message(pending // 2)
+        guild_message = make_message(pending // 2, guild=object())
+        number = max(1, 200_000 // pending)
+
+        scan = timeit.timeit(lambda: [p(dm) for p in predicates],
+                             number=number) / number
+        routed = timeit.timeit(lambda: router.route(dm),
+                               number=200_000) / 200_000
+        ignored = timeit.timeit(lambda: router.route(guild_message),
+                                number=200_000) / 200_000
+        print(f"{pending:>8} {scan * 1e6:>12.2f} us {routed * 1e9:>9.0f} ns "
+              f"{ignored * 1e9:>11.0f} ns")
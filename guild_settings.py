@@ -0,0 +1,116 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+import database
+
+SETTING_COLUMNS = ('min_account_age_days', 'review_channel_id',
+                   'verified_role_id', 'review_mode', 'questionnaire_mode')
+
+
+@dataclass(frozen=True)
+class GuildSettings:
+    """Effective verification settings for one guild"""
+    guild_id: Optional[int]
+    min_account_age_days: int
+    review_channel_id: Optional[int]
+    verified_role_id: Optional[int]
+    review_mode: str
+    questionnaire_mode: str
+
+    def review_channel(self, guild):
+        """The guild's review channel, or None if unset or not visible"""
+        if self.review_channel_id is None or guild is None:
+            return None
+        return guild.get_channel(self.review_channel_id)
+
+    def verified_role(self, guild):
+        """The guild's verified role, or None if unset or missing"""
+        if self.verified_role_id is None or guild is None:
+            return None
+        return guild.get_role(self.verified_role_id)
+
+
+class GuildSettingsStore:
+    """Per-guild settings in SQLite behind an in-memory LRU cache.
+
+    A guild's row is loaded the first time it is looked up; after that the
+    verify/approve path is a dict hit. Anything a guild hasn't overridden
+    falls back to config.json, which keeps single-server setups working
+    without any per-guild configuration.
+    """
+
+    def __init__(self, defaults, path=database.DB_PATH, cache_size=1024):
+        self.conn = database.connect(path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS guild_settings (
+                guild_id INTEGER PRIMARY KEY,
+                min_account_age_days INTEGER,
+                review_channel_id INTEGER,
+                verified_role_id INTEGER,
+                review_mode TEXT,
+                questionnaire_mode TEXT
+            )""")
+        database.ensure_columns(self.conn, 'guild_settings',
+                                {
+                                    'review_mode': 'TEXT',
+                                    'questionnaire_mode': 'TEXT'
+                                })
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._defaults = defaults
+
+    def set_defaults(self, defaults):
+        """Swap the config.json fallback, e.g. after a config reload"""
+        self._defaults = defaults
+        self._cache.clear()
+
+    def get(self, guild_id):
+        """Effective settings for a guild (None for DMs gets the defaults)"""
+        settings = self._cache.get(guild_id)
+        if settings is not None:
+            self._cache.move_to_end(guild_id)
+            return settings
+
+        row = None
+        if guild_id is not None:
+            row = self.conn.execute(
+                "SELECT * FROM guild_settings WHERE guild_id = ?",
+                (guild_id, )).fetchone()
+        values = {
+            column: row[column] if row and row[column] is not None else
+            getattr(self._defaults, column)
+            for column in SETTING_COLUMNS
+        }
+        settings = GuildSettings(guild_id=guild_id, **values)
+
+        self._cache[guild_id] = settings
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return settings
+
+    def update(self, guild_id, **overrides):
+        """Persist overrides for a guild and return its new settings"""
+        unknown = set(overrides) - set(SETTING_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown guild settings: {sorted(unknown)}")
+
+        self.conn.execute(
+            "INSERT OR IGNORE INTO guild_settings (guild_id) VALUES (?)",
+            (guild_id, ))
+        if overrides:
+            assignments = ", ".join(f"{column} = ?" for column in overrides)
+            self.conn.execute(
+                f"UPDATE guild_settings SET {assignments} WHERE guild_id = ?",
+                (*overrides.values(), guild_id))
+        self.conn.commit()
+
+        self._cache.pop(guild_id, None)
+        return self.get(guild_id)
+
+    def reset(self, guild_id):
+        """Drop a guild's overrides so it falls back to config.json"""
+        self.conn.execute("DELETE FROM guild_settings WHERE guild_id = ?",
+                          (guild_id, ))
+        self.conn.commit()
+        self._cache.pop(guild_id, None)
@@ -0,0 +1,86 @@
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line"""
+
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        if record.exc_text:
+            entry['exc_info'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the listener's handlers"""
+
+    def prepare(self, record):
+        # Resolve args and tracebacks now (they may not survive the thread
+        # hop) but keep the bare message so each handler applies its own format
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(
+                record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _file_handler(path):
+    """Size- or time-rotating file handler, chosen by environment"""
+    backup_count = int(os.environ.get('LOG_BACKUP_COUNT', '5'))
+    rotate_when = os.environ.get('LOG_ROTATE_WHEN')
+    if rotate_when:
+        # e.g. LOG_ROTATE_WHEN=midnight or LOG_ROTATE_WHEN=H
+        return logging.handlers.TimedRotatingFileHandler(
+            path, when=rotate_when, backupCount=backup_count, encoding='utf-8')
+    max_bytes = int(os.environ.get('LOG_MAX_BYTES', str(10 * 1024 * 1024)))
+    return logging.handlers.RotatingFileHandler(path,
+                                                maxBytes=max_bytes,
+                                                backupCount=backup_count,
+                                                encoding='utf-8')
+
+
+def setup_logging(path='discord_bot.log', level=logging.INFO):
+    """Route all logging through a queue drained by a background thread.
+
+    Callers on the event loop only enqueue the record; formatting, rotation
+    and disk/console writes happen on the listener thread, so a burst of log
+    lines never blocks gateway heartbeats. Set LOG_JSON=1 for JSON lines in
+    the log file.
+    """
+    formatter = logging.Formatter(LOG_FORMAT)
+    file_handler = _file_handler(path)
+    if os.environ.get('LOG_JSON', '').lower() in ('1', 'true', 'yes'):
+        file_handler.setFormatter(JsonFormatter())
+    else:
+        file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue,
+                                              file_handler,
+                                              stream_handler,
+                                              respect_handler_level=True)
+    logging.basicConfig(level=level,
+                        handlers=[_QueueHandler(log_queue)],
+                        force=True)
+    listener.start()
+    # Flush whatever is still queued on interpreter exit
+    atexit.register(listener.stop)
+    return listener
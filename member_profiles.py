@@ -0,0 +1,136 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Optional
+
+DAY = 86400
+
+# Score thresholds for the labels moderators see
+ALT_RISK_LABELS = ((60, "🔴 High"), (30, "🟠 Medium"), (0, "🟢 Low"))
+
+
+def alt_score(account_age_days, join_gap_days, has_avatar, approvals,
+              rejections):
+    """0-100 likelihood that an account is a throwaway/alt; higher is riskier.
+
+    join_gap_days is how long the account existed before joining the
+    server (None if unknown). Weights are deliberately simple so the score
+    can be explained to the moderator reading it.
+    """
+    score = 0
+    if account_age_days < 7:
+        score += 40
+    elif account_age_days < 30:
+        score += 25
+    elif account_age_days < 90:
+        score += 10
+    if join_gap_days is not None and join_gap_days < 1:
+        score += 20  # created just to join this server
+    if not has_avatar:
+        score += 10
+    score += min(rejections, 2) * 15
+    if approvals:
+        score -= 20  # already vouched for by a moderator before
+    return max(0, min(100, score))
+
+
+def alt_risk_label(score):
+    for threshold, label in ALT_RISK_LABELS:
+        if score >= threshold:
+            return label
+
+
+@dataclass(frozen=True)
+class MemberProfile:
+    """What the verification flow needs to know about a member up front"""
+    guild_id: int
+    user_id: int
+    created_at: float
+    joined_at: Optional[float]
+    has_avatar: bool
+    approvals: int
+    rejections: int
+    loaded_at: float
+
+    def account_age_days(self, now=None):
+        now = time.time() if now is None else now
+        return int((now - self.created_at) // DAY)
+
+    @property
+    def alt_score(self):
+        join_gap_days = None
+        if self.joined_at is not None:
+            join_gap_days = (self.joined_at - self.created_at) / DAY
+        return alt_score(self.account_age_days(self.loaded_at), join_gap_days,
+                         self.has_avatar, self.approvals, self.rejections)
+
+
+class MemberProfileCache:
+    """Member metadata and prior outcomes, keyed by (guild, user), with TTL.
+
+    Profiles are built on member join so the verify button and review embed
+    read a dict instead of recomputing account age and querying the audit
+    log. Entries expire after ``ttl`` seconds and the least recently used
+    are evicted past ``max_size``.
+    """
+
+    def __init__(self, audit_log, ttl=3600, max_size=10000):
+        self.audit_log = audit_log
+        self.ttl = ttl
+        self.max_size = max_size
+        self._profiles = OrderedDict()
+
+    def __len__(self):
+        return len(self._profiles)
+
+    def get(self, guild_id, user_id):
+        """The cached profile, or None if missing or expired"""
+        key = (guild_id, user_id)
+        profile = self._profiles.get(key)
+        if profile is None:
+            return None
+        if time.time() - profile.loaded_at > self.ttl:
+            del self._profiles[key]
+            return None
+        self._profiles.move_to_end(key)
+        return profile
+
+    def load(self, guild_id, user):
+        """Build and cache a profile from a Member (or a User who left)"""
+        outcomes = self.audit_log.outcome_counts(guild_id, user.id)
+        joined_at = getattr(user, 'joined_at', None)
+        profile = MemberProfile(
+            guild_id=guild_id,
+            user_id=user.id,
+            created_at=user.created_at.timestamp(),
+            joined_at=joined_at.timestamp() if joined_at else None,
+            has_avatar=user.avatar is not None,
+            approvals=outcomes.get('approved', 0),
+            rejections=outcomes.get('rejected', 0),
+            loaded_at=time.time())
+        self._store(profile)
+        return profile
+
+    def get_or_load(self, guild_id, user):
+        return self.get(guild_id, user.id) or self.load(guild_id, user)
+
+    def record_outcome(self, guild_id, user_id, action):
+        """Count a new decision in the cached profile, if there is one"""
+        profile = self._profiles.get((guild_id, user_id))
+        if profile is None:
+            return
+        if action == 'approved':
+            profile = replace(profile, approvals=profile.approvals + 1)
+        elif action == 'rejected':
+            profile = replace(profile, rejections=profile.rejections + 1)
+        self._profiles[(guild_id, user_id)] = profile
+
+    def discard(self, guild_id, user_id):
+        self._profiles.pop((guild_id, user_id), None)
+
+    def _store(self, profile):
+        key = (profile.guild_id, profile.user_id)
+        self._profiles[key] = profile
+        self._profiles.move_to_end(key)
+        if len(self._profiles) > self.max_size:
+            self._profiles.popitem(last=False)
@@ -0,0 +1,692 @@
+import asyncio
+import io
+import logging
+import time
+from datetime import datetime, timezone
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+from discord.ui import View
+
+from component_router import ComponentRoutes, page_number, snowflake
+from deferral import DEFER_UPDATE, auto_defer, edit_message, respond
+from dm_outbox import PRIORITY_MODERATION
+from member_profiles import alt_risk_label
+from services import (audit_log, bot, component_router, dm_outbox,
+                      guild_settings, member_profiles, resolve_member,
+                      review_queue, settings_for)
+
+logger = logging.getLogger(__name__)
+
+# Registered with component_router when the cog loads
+components = ComponentRoutes()
+
+
+def build_review_embed(request):
+    """Create the review embed for a queued request"""
+    user = bot.get_user(request.user_id)
+    answers = request.answers
+
+    review_embed = discord.Embed(
+        title="🔞 NSFW Verification Request",
+        color=0xff0000 if request.duplicate_of else 0xffa500,
+        timestamp=datetime.fromtimestamp(request.submitted_at, timezone.utc))
+    review_embed.add_field(
+        name="👤 User",
+        value=f"<@{request.user_id}> ({user or request.user_id})",
+        inline=False)
+    review_embed.add_field(name="🆔 Username & ID",
+                           value=answers[0],
+                           inline=False)
+    review_embed.add_field(name="🎂 Age", value=answers[1], inline=True)
+    review_embed.add_field(name="✅ Consent", value=answers[2], inline=True)
+    review_embed.add_field(name="📜 Agreed to Rules",
+                           value=answers[3],
+                           inline=True)
+    review_embed.add_field(name="📅 Account Created",
+                           value=discord.utils.snowflake_time(
+                               request.user_id).strftime("%Y-%m-%d"),
+                           inline=True)
+    review_embed.add_field(name="⏰ Account Age",
+                           value=f"{request.account_age_days} days",
+                           inline=True)
+    if request.alt_score is not None:
+        review_embed.add_field(
+            name="🕵️ Alt Risk",
+            value=f"{alt_risk_label(request.alt_score)} ({request.alt_score}/100)",
+            inline=True)
+    review_embed.add_field(name="🖼️ Age Verification",
+                           value=f"[View Screenshot]({request.image_url})"
+                           if request.has_screenshot else request.image_url,
+                           inline=False)
+    if request.duplicate_of:
+        review_embed.add_field(
+            name="⚠️ Reused Screenshot",
+            value="Same image as earlier submissions from " +
+            ", ".join(f"<@{user_id}>" for user_id in request.duplicate_of),
+            inline=False)
+    if user is not None:
+        review_embed.set_thumbnail(url=user.display_avatar.url)
+    return review_embed
+
+
+PAGER_REFRESH_DELAY = 5  # seconds; coalesces bursts of submissions into one edit
+
+
+pending_pager_refreshes = {}
+
+
+def render_review_page(guild_id, position):
+    """Embed and view for one page of a guild's review queue"""
+    total = review_queue.pending_count(guild_id)
+    if total == 0:
+        embed = discord.Embed(title="📭 Verification Queue Empty",
+                              description="No verification requests are waiting for review.",
+                              color=0x00ff00,
+                              timestamp=discord.utils.utcnow())
+        return embed, None, 0
+
+    position = min(max(position, 0), total - 1)
+    request = review_queue.pending_at(guild_id, position)
+    embed = build_review_embed(request)
+    embed.set_footer(text=f"Request {position + 1} of {total} pending")
+
+    view = View(timeout=None)
+    view.add_item(
+        component_router.button("rqpage", max(position - 1, 0),
+                                label="◀ Prev",
+                                style=discord.ButtonStyle.secondary,
+                                disabled=position == 0))
+    view.add_item(
+        component_router.button("rqpage", position + 1,
+                                label="Next ▶",
+                                style=discord.ButtonStyle.secondary,
+                                disabled=position >= total - 1))
+    view.add_item(
+        component_router.button("rqapprove", request.id,
+                                label="✅ Approve",
+                                style=discord.ButtonStyle.success))
+    view.add_item(
+        component_router.button("rqreject", request.id,
+                                label="❌ Reject",
+                                style=discord.ButtonStyle.danger))
+    return embed, view, position
+
+
+def schedule_pager_refresh(guild_id):
+    """Refresh a guild's review pager soon, at most once per delay window"""
+    if guild_id not in pending_pager_refreshes:
+        pending_pager_refreshes[guild_id] = asyncio.create_task(
+            refresh_pager_later(guild_id))
+
+
+async def refresh_pager_later(guild_id):
+    try:
+        await asyncio.sleep(PAGER_REFRESH_DELAY)
+        await refresh_review_pager(bot.get_guild(guild_id))
+    except Exception as e:
+        logger.error(f"Error refreshing review queue for guild {guild_id}: {e}")
+    finally:
+        pending_pager_refreshes.pop(guild_id, None)
+
+
+async def refresh_review_pager(guild):
+    """Re-render a guild's review pager, posting a new one if it is gone"""
+    channel = guild_settings.get(guild.id).review_channel(guild)
+    if channel is None:
+        logger.error(f"Review channel for {guild} not found or bot lacks access")
+        return
+
+    pager = review_queue.pager(guild.id)
+    position = pager.position if pager else 0
+    embed, view, position = render_review_page(guild.id, position)
+
+    if pager is not None and pager.channel_id == channel.id:
+        try:
+            await channel.get_partial_message(pager.message_id).edit(
+                embed=embed, view=view)
+            review_queue.set_pager_position(guild.id, position)
+            return
+        except discord.NotFound:
+            pass
+
+    message = await channel.send(embed=embed, view=view)
+    review_queue.set_pager(guild.id, channel.id, message.id, position)
+
+
+class DecisionError(Exception):
+    """A verification decision could not be applied; str() is shown to the moderator"""
+
+
+async def approve_verification(guild, user_id, moderator):
+    """Grant the verified role, record the decision and DM the user"""
+    user = await resolve_member(guild, user_id)
+    if not user:
+        raise DecisionError("❌ User not found in server.")
+
+    settings = settings_for(guild)
+    if settings.verified_role_id is None:
+        logger.error("Verified role ID not configured properly")
+        raise DecisionError("❌ Verified role not configured.")
+
+    role = settings.verified_role(guild)
+    if not role:
+        logger.error(f"Verified role {settings.verified_role_id} not found")
+        raise DecisionError("❌ Verified role not found.")
+
+    try:
+        await user.add_roles(
+            role, reason=f"NSFW verification approved by {moderator}")
+    except discord.Forbidden:
+        logger.error(f"No permission to assign role to {user}")
+        raise DecisionError("❌ I don't have permission to assign roles.")
+
+    review_queue.resolve_user(guild.id, user_id, 'approved')
+    audit_log.record('approved', guild.id, user_id, moderator.id)
+    member_profiles.record_outcome(guild.id, user_id, 'approved')
+
+    dm_outbox.post(
+        user, "🎉 **Verification Approved!**\n\n"
+        "Congratulations! You have been approved for NSFW access.\n"
+        "You can now access all NSFW channels and content in the server.\n\n"
+        "Please remember to follow all server rules and guidelines. Enjoy! ✨",
+        PRIORITY_MODERATION)
+
+    logger.info(f"NSFW verification approved for {user} by {moderator}")
+    return user
+
+
+async def reject_verification(guild, user_id, moderator):
+    """Record a rejection and DM the user if they are still reachable"""
+    review_queue.resolve_user(guild.id, user_id, 'rejected')
+    audit_log.record('rejected', guild.id, user_id, moderator.id)
+    member_profiles.record_outcome(guild.id, user_id, 'rejected')
+
+    user = await resolve_member(guild, user_id)
+    if user is None:
+        logger.info(
+            f"NSFW verification rejected for {user_id} (left the server) by {moderator}")
+        return None
+
+    dm_outbox.post(
+        user, "❌ **Verification Rejected**\n\n"
+        "Unfortunately, your NSFW verification request has been rejected.\n\n"
+        "This could be due to:\n"
+        "• Insufficient age verification\n"
+        "• Incomplete or unclear responses\n"
+        "• Not meeting server requirements\n\n"
+        "If you believe this was an error, please contact a moderator directly.",
+        PRIORITY_MODERATION)
+
+    logger.info(f"NSFW verification rejected for {user} by {moderator}")
+    return user
+
+
+async def claim_review(interaction, user_id, status):
+    """Claim a review message's pending requests; None if already handled
+
+    A bulk or pager decision may have resolved them while this message's
+    buttons stayed live, so the claim happens before any await. Messages
+    that predate the review queue (including legacy approve_<id> ones) have
+    no requests to claim and are decided as before.
+    """
+    request_ids = review_queue.claim_user(interaction.guild.id, user_id,
+                                          status)
+    if request_ids is None:
+        await respond(
+            interaction,
+            "⚠️ This request has already been handled.", ephemeral=True)
+    return request_ids
+
+
+@components.component("approve", payload=snowflake)
+@auto_defer(DEFER_UPDATE)
+async def handle_approval(interaction, user_id):
+    """Handle verification approval"""
+    request_ids = await claim_review(interaction, user_id, 'approved')
+    if request_ids is None:
+        return
+    try:
+        user = await approve_verification(interaction.guild, user_id,
+                                          interaction.user)
+    except DecisionError as e:
+        review_queue.reopen(*request_ids)
+        await respond(interaction, str(e), ephemeral=True)
+        return
+    except Exception as e:
+        review_queue.reopen(*request_ids)
+        await respond(
+            interaction,
+            "❌ An error occurred while approving.", ephemeral=True)
+        logger.error(f"Error approving {user_id}: {e}")
+        return
+
+    # Update the original message
+    embed = interaction.message.embeds[0]
+    embed.color = 0x00ff00  # Green
+    embed.title = "✅ NSFW Verification - APPROVED"
+    embed.add_field(name="📋 Action",
+                    value=f"Approved by {interaction.user.mention}",
+                    inline=False)
+
+    await edit_message(interaction, embed=embed, view=None)
+    await respond(
+        interaction,
+        f"✅ **Approved** {user.mention} for NSFW access.", ephemeral=True)
+
+
+@components.component("reject", payload=snowflake)
+@auto_defer(DEFER_UPDATE)
+async def handle_rejection(interaction, user_id):
+    """Handle verification rejection"""
+    request_ids = await claim_review(interaction, user_id, 'rejected')
+    if request_ids is None:
+        return
+    try:
+        await reject_verification(interaction.guild, user_id, interaction.user)
+    except Exception as e:
+        review_queue.reopen(*request_ids)
+        await respond(
+            interaction,
+            "❌ An error occurred while rejecting.", ephemeral=True)
+        logger.error(f"Error rejecting {user_id}: {e}")
+        return
+
+    # Update the original message
+    embed = interaction.message.embeds[0]
+    embed.color = 0xff0000  # Red
+    embed.title = "❌ NSFW Verification - REJECTED"
+    embed.add_field(name="📋 Action",
+                    value=f"Rejected by {interaction.user.mention}",
+                    inline=False)
+
+    await edit_message(interaction, embed=embed, view=None)
+    await respond(
+        interaction,
+        f"❌ **Rejected** <@{user_id}>'s verification request.",
+        ephemeral=True)
+
+
+@components.component("rqpage", payload=page_number)
+async def handle_queue_page(interaction, position):
+    """Move the review pager to another page"""
+    embed, view, position = render_review_page(interaction.guild.id, position)
+    await interaction.response.edit_message(embed=embed, view=view)
+    review_queue.set_pager_position(interaction.guild.id, position)
+
+
+async def handle_queue_decision(interaction, request_id, status, decide):
+    """Apply a moderator's decision from the review pager"""
+    guild = interaction.guild
+    request = review_queue.get(request_id)
+    # Claim the request before any await so a second click can't double-apply
+    if request is None or request.guild_id != guild.id or not review_queue.resolve(
+            request_id, status):
+        await respond(
+            interaction,
+            "⚠️ This request has already been handled.", ephemeral=True)
+        return
+
+    try:
+        await decide(guild, request.user_id, interaction.user)
+    except DecisionError as e:
+        review_queue.reopen(request_id)
+        await respond(interaction, str(e), ephemeral=True)
+        return
+    except Exception as e:
+        review_queue.reopen(request_id)
+        await respond(
+            interaction,
+            "❌ An error occurred while applying the decision.", ephemeral=True)
+        logger.error(f"Error deciding queued request {request_id}: {e}")
+        return
+
+    # The next request slides into the current position
+    pager = review_queue.pager(guild.id)
+    embed, view, position = render_review_page(guild.id,
+                                               pager.position if pager else 0)
+    await edit_message(interaction, embed=embed, view=view)
+    review_queue.set_pager_position(guild.id, position)
+
+    label = "✅ **Approved**" if status == 'approved' else "❌ **Rejected**"
+    await respond(interaction, f"{label} <@{request.user_id}>.",
+                  ephemeral=True)
+
+
+@components.component("rqapprove", payload=snowflake)
+@auto_defer(DEFER_UPDATE)
+async def handle_queue_approval(interaction, request_id):
+    await handle_queue_decision(interaction, request_id, 'approved',
+                                approve_verification)
+
+
+@components.component("rqreject", payload=snowflake)
+@auto_defer(DEFER_UPDATE)
+async def handle_queue_rejection(interaction, request_id):
+    await handle_queue_decision(interaction, request_id, 'rejected',
+                                reject_verification)
+
+
+BULK_WORKERS = 4  # concurrent decisions; discord.py queues each route bucket behind these
+
+
+BULK_PROGRESS_INTERVAL = 2  # seconds between progress edits
+
+
+async def apply_bulk_decision(guild, request, status, decide, moderator):
+    """Decide one queued request; returns (request, outcome, detail)"""
+    if not review_queue.resolve(request.id, status):
+        return request, 'skipped', "already handled"
+    try:
+        await decide(guild, request.user_id, moderator)
+        return request, 'done', status
+    except DecisionError as e:
+        review_queue.reopen(request.id)
+        return request, 'failed', str(e)
+    except Exception as e:
+        review_queue.reopen(request.id)
+        logger.error(f"Error in bulk decision for {request.user_id}: {e}")
+        return request, 'failed', f"error: {e}"
+
+
+async def report_bulk_progress(interaction, results, total):
+    """Periodically edit the deferred response with progress"""
+    while True:
+        await asyncio.sleep(BULK_PROGRESS_INTERVAL)
+        await interaction.edit_original_response(
+            content=f"⏳ Processed {len(results)}/{total} requests...")
+
+
+async def run_bulk_decision(interaction, status, decide, older_than_minutes,
+                            min_account_age_days, has_screenshot, limit):
+    """Apply one decision to every pending request matching the filters"""
+    if not interaction.user.guild_permissions.manage_roles:
+        await interaction.response.send_message(
+            "❌ You need Manage Roles permissions to use this command.",
+            ephemeral=True)
+        return
+
+    guild = interaction.guild
+    requests = review_queue.pending(
+        guild.id,
+        submitted_before=time.time() - older_than_minutes * 60,
+        min_account_age_days=min_account_age_days,
+        has_screenshot=has_screenshot,
+        limit=limit)
+    if not requests:
+        await interaction.response.send_message(
+            "📭 No pending requests match those filters.", ephemeral=True)
+        return
+
+    await interaction.response.defer(ephemeral=True, thinking=True)
+    logger.info(
+        f"Bulk {status} of {len(requests)} requests started by {interaction.user} in {guild}")
+
+    work = asyncio.Queue()
+    for request in requests:
+        work.put_nowait(request)
+    results = []
+
+    async def worker():
+        while not work.empty():
+            request = work.get_nowait()
+            results.append(await apply_bulk_decision(guild, request, status,
+                                                     decide, interaction.user))
+
+    reporter = asyncio.create_task(
+        report_bulk_progress(interaction, results, len(requests)))
+    try:
+        await asyncio.gather(
+            *(worker() for _ in range(min(BULK_WORKERS, len(requests)))))
+    finally:
+        reporter.cancel()
+
+    if guild_settings.get(guild.id).review_mode == 'queue':
+        schedule_pager_refresh(guild.id)
+
+    counts = {'done': 0, 'skipped': 0, 'failed': 0}
+    for _, outcome, _ in results:
+        counts[outcome] += 1
+    label = "✅ Approved" if status == 'approved' else "❌ Rejected"
+    embed = discord.Embed(title="📦 Bulk Verification Complete",
+                          color=0x00ff00 if counts['failed'] == 0 else 0xffa500)
+    embed.add_field(name=label, value=str(counts['done']), inline=True)
+    embed.add_field(name="⏭️ Already Handled",
+                    value=str(counts['skipped']),
+                    inline=True)
+    embed.add_field(name="⚠️ Failed", value=str(counts['failed']), inline=True)
+
+    report = "\n".join(f"{request.user_id}\t{outcome}\t{detail}"
+                       for request, outcome, detail in results)
+    await interaction.edit_original_response(
+        content=None,
+        embed=embed,
+        attachments=[
+            discord.File(io.BytesIO(report.encode('utf-8')),
+                         filename="bulk_results.txt")
+        ])
+    logger.info(
+        f"Bulk {status} by {interaction.user} in {guild} finished: {counts}")
+
+
+AUDIT_ACTION_LABELS = {'approved': "✅ Approved", 'rejected': "❌ Rejected"}
+
+
+class Moderation(commands.Cog):
+    """The moderator side: review messages, the queue pager and decisions"""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    async def cog_load(self):
+        self.bot.add_dynamic_items(*component_router.add_routes(components))
+
+    async def cog_unload(self):
+        self.bot.remove_dynamic_items(
+            *component_router.remove_routes(components))
+
+    @commands.Cog.listener()
+    async def on_verification_submitted(self, request):
+        """Put a request the verification extension queued in front of moderators"""
+        guild = self.bot.get_guild(request.guild_id)
+        try:
+            settings = settings_for(guild)
+            if settings.review_mode == 'queue':
+                # The pager picks the request up on its next (debounced) refresh
+                schedule_pager_refresh(guild.id)
+                return
+
+            channel = settings.review_channel(guild)
+            if channel is None:
+                logger.error(f"Review channel for {guild} not found or bot lacks access")
+                return
+            view = View(timeout=None)
+            view.add_item(
+                component_router.button("approve", request.user_id,
+                                        label="✅ Approve",
+                                        style=discord.ButtonStyle.success))
+            view.add_item(
+                component_router.button("reject", request.user_id,
+                                        label="❌ Reject",
+                                        style=discord.ButtonStyle.danger))
+            await channel.send(embed=build_review_embed(request), view=view)
+        except Exception as e:
+            logger.error(
+                f"Error posting verification request for {request.user_id}: {e}")
+
+    @app_commands.command(name="setup",
+                          description="Configure verification for this server (Admin only)")
+    @app_commands.describe(
+        review_channel="Channel where verification requests are posted",
+        verified_role="Role given to approved members",
+        min_account_age_days="Minimum account age in days",
+        review_mode="Post one review message per request, or page through a single queue message",
+        questionnaire_mode="Ask questions one DM at a time, or in a single form from the verify button",
+        reset="Forget this server's settings and use the bot defaults")
+    @app_commands.choices(review_mode=[
+        app_commands.Choice(name="One message per request", value="message"),
+        app_commands.Choice(name="Paginated queue", value="queue")
+    ])
+    @app_commands.choices(questionnaire_mode=[
+        app_commands.Choice(name="DM questions", value="dm"),
+        app_commands.Choice(name="Single form", value="modal")
+    ])
+    @app_commands.guild_only()
+    async def slash_setup(self, interaction: discord.Interaction,
+                          review_channel: discord.TextChannel = None,
+                          verified_role: discord.Role = None,
+                          min_account_age_days: app_commands.Range[int, 0,
+                                                                   3650] = None,
+                          review_mode: app_commands.Choice[str] = None,
+                          questionnaire_mode: app_commands.Choice[str] = None,
+                          reset: bool = False):
+        """Configure per-server verification settings - Admin only"""
+        try:
+            if not interaction.user.guild_permissions.administrator:
+                await interaction.response.send_message(
+                    "❌ You need Administrator permissions to use this command.",
+                    ephemeral=True)
+                return
+
+            guild = interaction.guild
+            if reset:
+                guild_settings.reset(guild.id)
+            else:
+                overrides = {}
+                if review_channel is not None:
+                    overrides['review_channel_id'] = review_channel.id
+                if verified_role is not None:
+                    overrides['verified_role_id'] = verified_role.id
+                if min_account_age_days is not None:
+                    overrides['min_account_age_days'] = min_account_age_days
+                if review_mode is not None:
+                    overrides['review_mode'] = review_mode.value
+                if questionnaire_mode is not None:
+                    overrides['questionnaire_mode'] = questionnaire_mode.value
+                if overrides:
+                    guild_settings.update(guild.id, **overrides)
+
+            settings = guild_settings.get(guild.id)
+            channel = settings.review_channel(guild)
+            role = settings.verified_role(guild)
+            embed = discord.Embed(title="⚙️ Verification Settings",
+                                  color=0x3498db)
+            embed.add_field(name="📝 Review Channel",
+                            value=channel.mention if channel else "Not set",
+                            inline=False)
+            embed.add_field(name="✅ Verified Role",
+                            value=role.mention if role else "Not set",
+                            inline=False)
+            embed.add_field(name="⏰ Minimum Account Age",
+                            value=f"{settings.min_account_age_days} days",
+                            inline=False)
+            embed.add_field(name="📋 Review Mode",
+                            value="Paginated queue" if settings.review_mode
+                            == 'queue' else "One message per request",
+                            inline=False)
+            embed.add_field(name="📝 Questionnaire",
+                            value="Single form" if settings.questionnaire_mode
+                            == 'modal' else "DM questions",
+                            inline=False)
+
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            if settings.review_mode == 'queue':
+                schedule_pager_refresh(guild.id)
+            logger.info(f"Verification settings for {guild} updated by {interaction.user}: {settings}")
+
+        except Exception as e:
+            logger.error(f"Error updating verification settings: {e}")
+            await interaction.response.send_message(
+                "An error occurred while updating settings.", ephemeral=True)
+
+    @app_commands.command(name="verifyhistory",
+                          description="Look up past verification decisions (Moderators only)")
+    @app_commands.describe(user="Show decisions about this user",
+                           moderator="Show decisions made by this moderator",
+                           limit="How many entries to show")
+    @app_commands.guild_only()
+    async def slash_verifyhistory(self, interaction: discord.Interaction,
+                                  user: discord.User = None,
+                                  moderator: discord.User = None,
+                                  limit: app_commands.Range[int, 1, 25] = 10):
+        """Show verification decisions from the audit log - Moderators only"""
+        try:
+            if not interaction.user.guild_permissions.manage_roles:
+                await interaction.response.send_message(
+                    "❌ You need Manage Roles permissions to use this command.",
+                    ephemeral=True)
+                return
+
+            started = time.perf_counter()
+            entries = audit_log.query(interaction.guild.id,
+                                      user_id=user.id if user else None,
+                                      moderator_id=moderator.id if moderator else None,
+                                      limit=limit)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+
+            lines = [
+                f"<t:{int(entry.created_at)}:f> {AUDIT_ACTION_LABELS.get(entry.action, entry.action)} "
+                f"<@{entry.user_id}> by <@{entry.moderator_id}>"
+                for entry in entries
+            ]
+            embed = discord.Embed(
+                title="📋 Verification History",
+                description="\n".join(lines) or "No matching decisions found.",
+                color=0x3498db)
+            embed.set_footer(text=f"{len(entries)} entries • {elapsed_ms:.1f}ms")
+
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            logger.info(f"Verification history requested by {interaction.user}")
+
+        except Exception as e:
+            logger.error(f"Error showing verification history: {e}")
+            await interaction.response.send_message(
+                "An error occurred while fetching verification history.",
+                ephemeral=True)
+
+    verify_group = app_commands.Group(name="verify",
+                                      description="Verification moderator tools",
+                                      guild_only=True)
+    bulk_group = app_commands.Group(
+        name="bulk",
+        description="Approve or reject many pending verification requests at once",
+        parent=verify_group)
+
+    @bulk_group.command(name="approve",
+                        description="Approve pending verification requests in bulk")
+    @app_commands.describe(
+        older_than_minutes="Only requests submitted at least this many minutes ago",
+        min_account_age_days="Only applicants whose account is at least this old",
+        has_screenshot="Only requests with (True) or without (False) a screenshot",
+        limit="Maximum number of requests to process")
+    async def slash_bulk_approve(self, interaction: discord.Interaction,
+                                 older_than_minutes: app_commands.Range[int, 0] = 0,
+                                 min_account_age_days: app_commands.Range[int, 0] = None,
+                                 has_screenshot: bool = None,
+                                 limit: app_commands.Range[int, 1, 500] = 100):
+        """Bulk-approve pending requests - Moderators only"""
+        await run_bulk_decision(interaction, 'approved', approve_verification,
+                                older_than_minutes, min_account_age_days,
+                                has_screenshot, limit)
+
+    @bulk_group.command(name="reject",
+                        description="Reject pending verification requests in bulk")
+    @app_commands.describe(
+        older_than_minutes="Only requests submitted at least this many minutes ago",
+        min_account_age_days="Only applicants whose account is at least this old",
+        has_screenshot="Only requests with (True) or without (False) a screenshot",
+        limit="Maximum number of requests to process")
+    async def slash_bulk_reject(self, interaction: discord.Interaction,
+                                older_than_minutes: app_commands.Range[int, 0] = 0,
+                                min_account_age_days: app_commands.Range[int, 0] = None,
+                                has_screenshot: bool = None,
+                                limit: app_commands.Range[int, 1, 500] = 100):
+        """Bulk-reject pending requests - Moderators only"""
+        await run_bulk_decision(interaction, 'rejected', reject_verification,
+                                older_than_minutes, min_account_age_days,
+                                has_screenshot, limit)
+
+
+async def setup(bot):
+    await bot.add_cog(Moderation(bot))
@@ -1,16 +1,39 @@
-from flask import Flask
-from threading import Thread
+from aiohttp import web
 
-app = Flask('')
+import metrics
 
-@app.route('/')
-def home():
-    return "Bot is alive!"
 
-def run():
-    app.run(host='0.0.0.0', port=8080)
+def create_app(health_check=None):
+    """Status, health and metrics routes.
 
-def keep_alive():
-    t = Thread(target=run)
-    t.start()
+    health_check() returns (healthy, details); without one /health always
+    reports ok.
+    """
 
+    async def home(request):
+        return web.Response(text="Bot is alive!")
+
+    async def prometheus_metrics(request):
+        return web.Response(body=metrics.render().encode(),
+                            headers={'Content-Type': metrics.CONTENT_TYPE})
+
+    async def health(request):
+        if health_check is None:
+            return web.json_response({'status': 'ok'})
+        healthy, details = health_check()
+        details['status'] = 'ok' if healthy else 'unhealthy'
+        return web.json_response(details, status=200 if healthy else 503)
+
+    app = web.Application()
+    app.router.add_get('/', home)
+    app.router.add_get('/metrics', prometheus_metrics)
+    app.router.add_get('/health', health)
+    return app
+
+
+async def start_web_server(health_check=None, host='0.0.0.0', port=8080):
+    """Serve the routes from the running event loop; returns the runner"""
+    runner = web.AppRunner(create_app(health_check), access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    return runner
@@ -0,0 +1,128 @@
+import logging
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+
+from discord import app_commands
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+HANDLER_SECONDS = metrics.histogram('handler_seconds',
+                                    'Time spent in commands and event handlers',
+                                    ['handler'])
+LOOP_BLOCKS = metrics.counter(
+    'event_loop_blocks_total',
+    'Times the event loop was blocked past the watchdog threshold')
+
+
+@dataclass
+class HandlerStats:
+    """Running timings for one handler"""
+    name: str
+    calls: int = 0
+    total: float = 0.0
+    slowest: float = 0.0
+
+    @property
+    def average(self):
+        return self.total / self.calls if self.calls else 0.0
+
+
+class HandlerProfiler:
+    """Time commands and event handlers and keep per-handler stats.
+
+    Handlers slower than ``slow_threshold`` are logged; Discord fails an
+    interaction that isn't answered within 3 seconds.
+    """
+
+    def __init__(self, slow_threshold=2.0):
+        self.slow_threshold = slow_threshold
+        self._stats = {}
+
+    def observe(self, name, seconds):
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = HandlerStats(name)
+        stats.calls += 1
+        stats.total += seconds
+        stats.slowest = max(stats.slowest, seconds)
+        HANDLER_SECONDS.observe(seconds, handler=name)
+        if seconds >= self.slow_threshold:
+            logger.warning(f"Slow handler {name} took {seconds:.2f}s")
+
+    def top(self, limit=10, key='slowest'):
+        """The ``limit`` worst handlers by slowest, average or total time"""
+        return sorted(self._stats.values(),
+                      key=lambda stats: getattr(stats, key),
+                      reverse=True)[:limit]
+
+
+class ProfiledCommandTree(app_commands.CommandTree):
+    """Command tree that times every slash command.
+
+    interaction_check stamps the start; call finished() from an
+    on_app_command_completion listener. Commands that raise are timed in
+    on_error.
+    """
+    profiler = None
+
+    async def interaction_check(self, interaction):
+        interaction.extras['started'] = time.perf_counter()
+        return True
+
+    def finished(self, interaction):
+        started = interaction.extras.get('started')
+        if self.profiler is None or started is None or interaction.command is None:
+            return
+        self.profiler.observe(f"/{interaction.command.qualified_name}",
+                              time.perf_counter() - started)
+
+    async def on_error(self, interaction, error):
+        self.finished(interaction)
+        await super().on_error(interaction, error)
+
+
+class BlockingWatchdog:
+    """Thread that logs the event loop's stack when the loop stops ticking.
+
+    A blocked loop can't report on itself, so this samples the loop
+    thread's current frame from outside once the LoopLagMonitor is more
+    than ``threshold`` seconds overdue, which points at the blocking code.
+    """
+
+    def __init__(self, monitor, threshold=1.0, check_interval=0.1):
+        self.monitor = monitor
+        self.threshold = threshold
+        self.check_interval = check_interval
+        self._loop_thread_id = None
+        self._thread = None
+
+    def start(self):
+        """Start watching the calling thread's event loop"""
+        self._loop_thread_id = threading.get_ident()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run,
+                                            name="loop-watchdog",
+                                            daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        reported = False
+        while True:
+            time.sleep(self.check_interval)
+            stalled = self.monitor.stalled_for()
+            if stalled < self.threshold:
+                reported = False
+                continue
+            if reported:
+                continue
+            reported = True
+            LOOP_BLOCKS.inc()
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = ''.join(traceback.format_stack(frame)) if frame else ''
+            logger.warning(
+                f"Event loop blocked for {stalled:.2f}s, currently at:\n{stack}")
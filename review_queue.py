@@ -0,0 +1,222 @@
+import json
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+import database
+
+NO_SCREENSHOT = "No screenshot provided (skipped by user)"
+
+
+@dataclass(frozen=True)
+class ReviewRequest:
+    """A completed questionnaire waiting for (or past) moderator review"""
+    id: int
+    guild_id: int
+    user_id: int
+    answers: List[str]
+    account_age_days: int
+    image_url: str
+    submitted_at: float
+    status: str
+    # Users who earlier submitted the same (or a near-identical) screenshot
+    duplicate_of: List[int] = ()
+    # Anti-alt score (0-100) of the applicant when they submitted
+    alt_score: Optional[int] = None
+
+    @property
+    def has_screenshot(self):
+        return self.image_url != NO_SCREENSHOT
+
+
+@dataclass(frozen=True)
+class ReviewPager:
+    """The single paginated review message a guild uses in queue mode"""
+    guild_id: int
+    channel_id: int
+    message_id: int
+    position: int
+
+
+class ReviewQueue:
+    """Submitted verification requests and their review status"""
+
+    def __init__(self, path=database.DB_PATH):
+        self.conn = database.connect(path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS review_requests (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                answers TEXT NOT NULL,
+                account_age_days INTEGER NOT NULL,
+                image_url TEXT NOT NULL,
+                submitted_at REAL NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                duplicate_of TEXT NOT NULL DEFAULT '[]',
+                alt_score INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS idx_review_pending
+                ON review_requests (guild_id, status, submitted_at);
+            CREATE TABLE IF NOT EXISTS review_pagers (
+                guild_id INTEGER PRIMARY KEY,
+                channel_id INTEGER NOT NULL,
+                message_id INTEGER NOT NULL,
+                position INTEGER NOT NULL DEFAULT 0
+            );
+        """)
+        database.ensure_columns(self.conn, 'review_requests', {
+            'duplicate_of': "TEXT NOT NULL DEFAULT '[]'",
+            'alt_score': "INTEGER"
+        })
+
+    @staticmethod
+    def _from_row(row):
+        return ReviewRequest(id=row['id'],
+                             guild_id=row['guild_id'],
+                             user_id=row['user_id'],
+                             answers=json.loads(row['answers']),
+                             account_age_days=row['account_age_days'],
+                             image_url=row['image_url'],
+                             submitted_at=row['submitted_at'],
+                             status=row['status'],
+                             duplicate_of=json.loads(row['duplicate_of']),
+                             alt_score=row['alt_score'])
+
+    def add(self,
+            guild_id,
+            user_id,
+            answers,
+            account_age_days,
+            image_url,
+            duplicate_of=(),
+            alt_score=None):
+        """Queue a new pending request"""
+        submitted_at = time.time()
+        cursor = self.conn.execute(
+            "INSERT INTO review_requests "
+            "(guild_id, user_id, answers, account_age_days, image_url, submitted_at, "
+            "duplicate_of, alt_score) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (guild_id, user_id, json.dumps(answers), account_age_days,
+             image_url, submitted_at, json.dumps(list(duplicate_of)), alt_score))
+        self.conn.commit()
+        return ReviewRequest(id=cursor.lastrowid,
+                             guild_id=guild_id,
+                             user_id=user_id,
+                             answers=list(answers),
+                             account_age_days=account_age_days,
+                             image_url=image_url,
+                             submitted_at=submitted_at,
+                             status='pending',
+                             duplicate_of=list(duplicate_of),
+                             alt_score=alt_score)
+
+    def get(self, request_id):
+        row = self.conn.execute("SELECT * FROM review_requests WHERE id = ?",
+                                (request_id, )).fetchone()
+        return self._from_row(row) if row else None
+
+    def pending_count(self, guild_id):
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM review_requests "
+            "WHERE guild_id = ? AND status = 'pending'",
+            (guild_id, )).fetchone()[0]
+
+    def pending_at(self, guild_id, position):
+        """The pending request at a 0-based position, oldest first"""
+        row = self.conn.execute(
+            "SELECT * FROM review_requests "
+            "WHERE guild_id = ? AND status = 'pending' "
+            "ORDER BY submitted_at LIMIT 1 OFFSET ?",
+            (guild_id, position)).fetchone()
+        return self._from_row(row) if row else None
+
+    def pending(self,
+                guild_id,
+                submitted_before=None,
+                min_account_age_days=None,
+                has_screenshot=None,
+                limit=100):
+        """Pending requests matching the filters, oldest first"""
+        clauses = ["guild_id = ?", "status = 'pending'"]
+        params = [guild_id]
+        if submitted_before is not None:
+            clauses.append("submitted_at <= ?")
+            params.append(submitted_before)
+        if min_account_age_days is not None:
+            clauses.append("account_age_days >= ?")
+            params.append(min_account_age_days)
+        if has_screenshot is not None:
+            clauses.append("image_url != ?" if has_screenshot else "image_url = ?")
+            params.append(NO_SCREENSHOT)
+        rows = self.conn.execute(
+            f"SELECT * FROM review_requests WHERE {' AND '.join(clauses)} "
+            "ORDER BY submitted_at LIMIT ?", (*params, limit)).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    def resolve(self, request_id, status):
+        """Move a pending request to status; False if it wasn't pending"""
+        cursor = self.conn.execute(
+            "UPDATE review_requests SET status = ? "
+            "WHERE id = ? AND status = 'pending'", (status, request_id))
+        self.conn.commit()
+        return cursor.rowcount > 0
+
+    def reopen(self, *request_ids):
+        """Put requests back in the queue after a failed decision"""
+        self.conn.executemany(
+            "UPDATE review_requests SET status = 'pending' WHERE id = ?",
+            [(request_id, ) for request_id in request_ids])
+        self.conn.commit()
+
+    def claim_user(self, guild_id, user_id, status):
+        """Resolve a user's pending requests in a guild; returns their ids
+
+        None means another decision already resolved them. An empty list
+        means the user has no requests at all: their review message was
+        posted before this queue existed, so there is nothing to claim.
+        """
+        request_ids = [
+            row['id'] for row in self.conn.execute(
+                "SELECT id FROM review_requests "
+                "WHERE guild_id = ? AND user_id = ? AND status = 'pending'",
+                (guild_id, user_id))
+        ]
+        if not request_ids:
+            decided = self.conn.execute(
+                "SELECT 1 FROM review_requests "
+                "WHERE guild_id = ? AND user_id = ? LIMIT 1",
+                (guild_id, user_id)).fetchone()
+            return None if decided else []
+        self.conn.executemany(
+            "UPDATE review_requests SET status = ? WHERE id = ?",
+            [(status, request_id) for request_id in request_ids])
+        self.conn.commit()
+        return request_ids
+
+    def resolve_user(self, guild_id, user_id, status):
+        """Resolve every pending request a user has in a guild"""
+        self.conn.execute(
+            "UPDATE review_requests SET status = ? "
+            "WHERE guild_id = ? AND user_id = ? AND status = 'pending'",
+            (status, guild_id, user_id))
+        self.conn.commit()
+
+    def pager(self, guild_id):
+        row = self.conn.execute(
+            "SELECT * FROM review_pagers WHERE guild_id = ?",
+            (guild_id, )).fetchone()
+        return ReviewPager(**dict(row)) if row else None
+
+    def set_pager(self, guild_id, channel_id, message_id, position=0):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO review_pagers "
+            "(guild_id, channel_id, message_id, position) VALUES (?, ?, ?, ?)",
+            (guild_id, channel_id, message_id, position))
+        self.conn.commit()
+
+    def set_pager_position(self, guild_id, position):
+        self.conn.execute(
+            "UPDATE review_pagers SET position = ? WHERE guild_id = ?",
+            (position, guild_id))
+        self.conn.commit()
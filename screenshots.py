@@ -0,0 +1,360 @@
+import asyncio
+import hashlib
+import io
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List
+
+import aiohttp
+
+import database
+import metrics
+
+try:
+    from PIL import Image
+except ImportError:  # degraded: without Pillow only exact copies match
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+MAX_SCREENSHOT_BYTES = 8 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+
+HASH_DHASH = 'dhash'  # perceptual; survives re-encoding and resizing
+HASH_SHA256 = 'sha256'  # exact bytes only, fallback when Pillow is missing
+
+# Max differing bits (out of 64) for two dHashes to count as the same image
+MATCH_DISTANCE = {HASH_DHASH: 6, HASH_SHA256: 0}
+
+
+IMAGE_JOB_SECONDS = metrics.histogram(
+    'screenshot_job_seconds',
+    'Time screenshot jobs spent waiting for a worker and being processed',
+    ['stage'])
+IMAGE_JOBS = metrics.counter('screenshot_jobs_total',
+                             'Screenshot jobs by outcome', ['result'])
+IMAGE_JOBS_WAITING = metrics.gauge('screenshot_jobs_waiting',
+                                   'Screenshot jobs waiting for a free worker')
+
+
+class ScreenshotError(Exception):
+    """A screenshot could not be downloaded or decoded"""
+
+
+class ScreenshotTooLarge(ScreenshotError):
+    """A screenshot is over the size cap"""
+
+
+class ScreenshotBusy(ScreenshotError):
+    """Too many screenshots are already waiting to be processed"""
+
+
+async def download(session, url, max_bytes=MAX_SCREENSHOT_BYTES):
+    """Stream a file into memory, aborting as soon as it passes max_bytes"""
+    buffer = bytearray()
+    try:
+        async with session.get(url) as response:
+            if response.status != 200:
+                raise ScreenshotError(f"download failed with HTTP {response.status}")
+            if (response.content_length or 0) > max_bytes:
+                raise ScreenshotTooLarge(
+                    f"{response.content_length} bytes is over the {max_bytes} byte cap")
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                buffer += chunk
+                if len(buffer) > max_bytes:
+                    raise ScreenshotTooLarge(f"over the {max_bytes} byte cap")
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        raise ScreenshotError(f"download failed: {e}") from e
+    return bytes(buffer)
+
+
+def dhash(image, size=8):
+    """64-bit difference hash: brightness gradients of a 9x8 thumbnail"""
+    pixels = list(
+        image.convert('L').resize((size + 1, size),
+                                  Image.Resampling.LANCZOS).getdata())
+    value = 0
+    for row in range(size):
+        for col in range(size):
+            left = pixels[row * (size + 1) + col]
+            right = pixels[row * (size + 1) + col + 1]
+            value = (value << 1) | (left > right)
+    return value
+
+
+def fingerprint(data):
+    """Hash image bytes; returns (kind, 64-bit int)"""
+    if Image is None:
+        return HASH_SHA256, int.from_bytes(hashlib.sha256(data).digest()[:8],
+                                           'big')
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            return HASH_DHASH, dhash(image)
+    except Exception as e:
+        raise ScreenshotError(f"could not decode image: {e}") from e
+
+
+def hamming(a, b):
+    return bin(a ^ b).count('1')
+
+
+class HashIndex:
+    """Near-duplicate lookup over 64-bit hashes by Hamming distance.
+
+    Multi-index hashing: each hash is split into max_distance + 1 chunks and
+    filed under every chunk. Two hashes within max_distance bits of each
+    other must agree exactly on at least one chunk (pigeonhole), so a search
+    only compares against the few hashes sharing a chunk with the query
+    instead of scanning the whole index.
+    """
+
+    BITS = 64
+
+    def __init__(self, max_distance):
+        self.max_distance = max_distance
+        chunks = max_distance + 1
+        edges = [self.BITS * i // chunks for i in range(chunks + 1)]
+        self._chunks = [(start, (1 << (stop - start)) - 1)
+                        for start, stop in zip(edges, edges[1:])]
+        self._tables = [{} for _ in self._chunks]
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def add(self, value, item):
+        entry = (value, item)
+        for table, (shift, mask) in zip(self._tables, self._chunks):
+            table.setdefault((value >> shift) & mask, []).append(entry)
+        self._size += 1
+
+    def search(self, value):
+        """[(distance, item)] for every stored hash within max_distance"""
+        found = {}
+        for table, (shift, mask) in zip(self._tables, self._chunks):
+            for entry in table.get((value >> shift) & mask, ()):
+                if id(entry) not in found:
+                    distance = hamming(value, entry[0])
+                    if distance <= self.max_distance:
+                        found[id(entry)] = (distance, entry[1])
+        return list(found.values())
+
+
+@dataclass(frozen=True)
+class ScreenshotMatch:
+    """An earlier submission with the same (or a near-identical) image"""
+    user_id: int
+    distance: int
+
+
+class ScreenshotIndex:
+    """Hashes of submitted screenshots, persisted in SQLite.
+
+    The rows are loaded into one HashIndex per guild and hash kind at startup,
+    so checking a new screenshot never touches the database.
+    """
+
+    def __init__(self, path=database.DB_PATH):
+        self.conn = database.connect(path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS screenshot_hashes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                kind TEXT NOT NULL,
+                hash TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )""")
+        self._indexes = {}
+        for row in self.conn.execute(
+                "SELECT guild_id, user_id, kind, hash FROM screenshot_hashes"):
+            self._index(row['guild_id'],
+                        row['kind']).add(int(row['hash'], 16), row['user_id'])
+
+    def __len__(self):
+        return sum(len(index) for index in self._indexes.values())
+
+    def _index(self, guild_id, kind):
+        index = self._indexes.get((guild_id, kind))
+        if index is None:
+            index = self._indexes[(guild_id, kind)] = HashIndex(
+                MATCH_DISTANCE[kind])
+        return index
+
+    def matches(self, guild_id, user_id, kind, value):
+        """Other users in the guild who submitted a matching screenshot"""
+        best = {}
+        for distance, other in self._index(guild_id, kind).search(value):
+            if other != user_id and distance < best.get(other, 65):
+                best[other] = distance
+        return sorted((ScreenshotMatch(user_id=other, distance=distance)
+                       for other, distance in best.items()),
+                      key=lambda match: match.distance)
+
+    def add(self, guild_id, user_id, kind, value):
+        # Hex text: SQLite integers are signed 64-bit
+        self.conn.execute(
+            "INSERT INTO screenshot_hashes (guild_id, user_id, kind, hash, created_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (guild_id, user_id, kind, f"{value:016x}", time.time()))
+        self.conn.commit()
+        self._index(guild_id, kind).add(value, user_id)
+
+
+class ImageWorkerPool:
+    """Bounded thread pool for image work.
+
+    At most ``workers * 2`` jobs are handed to the pool at once; further
+    jobs wait their turn (on_wait lets the caller tell the applicant), and
+    past ``max_waiting`` they are turned away with ScreenshotBusy instead
+    of piling up in memory.
+
+    Threads, not processes: Pillow releases the GIL while it decodes and
+    resizes, which is nearly all of a job. Forking the bot, which already
+    runs the log listener, audit writer and watchdog threads, can deadlock
+    the child, and a spawned worker would re-run services.py's setup.
+    """
+
+    def __init__(self, workers=None, max_waiting=100):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_waiting = max_waiting
+        self._slots = None
+        self._waiting = 0
+        self._executor = None
+        IMAGE_JOBS_WAITING.set_function(lambda: self._waiting)
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                self.workers, thread_name_prefix='screenshot-worker')
+        return self._executor
+
+    async def run(self, function, *args, on_wait=None):
+        """Run function(*args) in the pool and return its result"""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.workers * 2)
+        if self._slots.locked():
+            if self._waiting >= self.max_waiting:
+                IMAGE_JOBS.inc(result='rejected')
+                raise ScreenshotBusy(f"{self._waiting} jobs already waiting")
+            if on_wait is not None:
+                on_wait()
+
+        queued = time.monotonic()
+        self._waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+        try:
+            started = time.monotonic()
+            IMAGE_JOB_SECONDS.observe(started - queued, stage='queued')
+            try:
+                result = await asyncio.get_running_loop().run_in_executor(
+                    self._get_executor(), function, *args)
+            except Exception:
+                IMAGE_JOBS.inc(result='error')
+                raise
+            IMAGE_JOB_SECONDS.observe(time.monotonic() - started,
+                                      stage='processing')
+            IMAGE_JOBS.inc(result='ok')
+            return result
+        finally:
+            self._slots.release()
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+@dataclass(frozen=True)
+class ScreenshotCheck:
+    """Result of running one screenshot through the pipeline"""
+    kind: str
+    value: int
+    matches: List[ScreenshotMatch]
+
+
+class ScreenshotPipeline:
+    """Download, hash and look up verification screenshots"""
+
+    def __init__(self, index, pool=None, max_bytes=MAX_SCREENSHOT_BYTES):
+        self.index = index
+        self.pool = pool or ImageWorkerPool()
+        self.max_bytes = max_bytes
+        self._session = None
+        if Image is None:
+            logger.warning(
+                "Pillow is not installed: reused screenshots are only detected "
+                "when byte-identical. Run pip install -r requirements.txt")
+
+    async def check(self, attachment, guild_id, user_id, on_wait=None):
+        """Fingerprint an attachment and record it in the index.
+
+        Raises ScreenshotTooLarge if it is over the cap, ScreenshotBusy if
+        the worker pool's queue is full and ScreenshotError if it can't be
+        fetched or decoded. on_wait is called if the job has to queue.
+        """
+        if attachment.size > self.max_bytes:
+            raise ScreenshotTooLarge(
+                f"{attachment.size} bytes is over the {self.max_bytes} byte cap")
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30))
+
+        data = await download(self._session, attachment.url, self.max_bytes)
+        kind, value = await self.pool.run(fingerprint, data, on_wait=on_wait)
+        matches = self.index.matches(guild_id, user_id, kind, value)
+        self.index.add(guild_id, user_id, kind, value)
+        return ScreenshotCheck(kind=kind, value=value, matches=matches)
+
+    async def close(self):
+        self.pool.shutdown()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+if __name__ == "__main__":
+    # Benchmark: near-duplicate lookup versus a linear scan and a BK-tree
+    # (which prunes almost nothing at radius 6 over 64 random bits)
+    import random
+    import timeit
+
+    def bk_search(root, query, radius):
+        found, stack = [], [root]
+        while stack:
+            value, children = stack.pop()
+            distance = hamming(query, value)
+            if distance <= radius:
+                found.append(value)
+            stack.extend(child for edge, child in children.items()
+                         if abs(edge - distance) <= radius)
+        return found
+
+    print(f"{'hashes':>8} {'scan':>10} {'bk-tree':>10} {'index':>10}")
+    for size in (1_000, 10_000, 100_000):
+        hashes = [random.getrandbits(64) for _ in range(size)]
+        index = HashIndex(MATCH_DISTANCE[HASH_DHASH])
+        root = (hashes[0], {})
+        for user_id, value in enumerate(hashes):
+            index.add(value, user_id)
+            node = root
+            while (distance := hamming(value, node[0])) in node[1]:
+                node = node[1][distance]
+            if distance:
+                node[1][distance] = (value, {})
+        query = hashes[-1] ^ 0b101  # a re-encoded copy of the last image
+        assert index.search(query) == [(2, size - 1)]
+
+        timings = [
+            timeit.timeit(search, number=20) / 20 for search in (
+                lambda: [v for v in hashes if hamming(v, query) <= 6],
+                lambda: bk_search(root, query, 6),
+                lambda: index.search(query))
+        ]
+        print(f"{size:>8}" + "".join(f" {t * 1e3:>7.3f} ms" for t in timings))
@@ -0,0 +1,97 @@
+# Process-wide state shared by main.py and the bot's extensions. It is created
+# once, so reloading an extension swaps its commands and handlers without
+# reopening the database or forgetting in-flight verification sessions.
+import logging
+import os
+
+import discord
+from discord.ext import commands
+
+from audit_log import AuditLog
+from bot_config import ConfigError, ConfigWatcher, load_config
+from bot_metrics import LoopLagMonitor, count_rate_limits, instrument_http
+from command_sync import CommandSync
+from component_router import ComponentRouter
+from dm_outbox import DMScheduler
+from dm_router import DMRouter
+from guild_settings import GuildSettingsStore
+from logging_setup import setup_logging
+from member_profiles import MemberProfileCache
+from profiler import BlockingWatchdog, HandlerProfiler, ProfiledCommandTree
+from review_queue import ReviewQueue
+from screenshots import ScreenshotIndex, ScreenshotPipeline
+from sessions import SessionAdmission, SessionStore
+
+# Set up logging
+setup_logging('discord_bot.log')
+logger = logging.getLogger(__name__)
+
+# Load configuration with error handling
+CONFIG_PATH = 'config.json'
+try:
+    config = load_config(CONFIG_PATH)
+    logger.info("Configuration loaded successfully")
+except ConfigError as e:
+    logger.error(str(e))
+    exit(1)
+config_watcher = ConfigWatcher(CONFIG_PATH)
+
+intents = discord.Intents.default()
+intents.members = True
+intents.message_content = True
+
+
+class VerificationBot(commands.Bot):
+    """commands.Bot that also releases the shared services when it closes"""
+
+    async def close(self):
+        await super().close()
+        # The aiohttp session and image worker threads outlive any extension
+        await screenshot_pipeline.close()
+
+
+bot = VerificationBot(command_prefix="!",
+                      intents=intents,
+                      tree_cls=ProfiledCommandTree)
+instrument_http(bot.http)
+count_rate_limits()
+loop_monitor = LoopLagMonitor()
+loop_watchdog = BlockingWatchdog(loop_monitor)
+handler_profiler = HandlerProfiler()
+bot.tree.profiler = handler_profiler
+
+session_store = SessionStore()
+session_admission = SessionAdmission(
+    config.max_concurrent_sessions,
+    (user_id for user_id, _ in session_store.routes()))
+open_modals = {}  # user id -> the VerificationModal they have open
+guild_settings = GuildSettingsStore(config)
+audit_log = AuditLog()
+member_profiles = MemberProfileCache(audit_log)
+review_queue = ReviewQueue()
+dm_router = DMRouter()
+dm_outbox = DMScheduler()
+screenshot_pipeline = ScreenshotPipeline(ScreenshotIndex())
+component_router = ComponentRouter(handler_profiler)
+command_sync = CommandSync(bot.tree)
+
+# Set DEV_GUILD_ID to sync commands to one test server instead of globally
+dev_guild = None
+if os.environ.get('DEV_GUILD_ID', '').isdigit():
+    dev_guild = discord.Object(int(os.environ['DEV_GUILD_ID']))
+
+
+def settings_for(guild):
+    """Effective verification settings for a guild (or DM)"""
+    return guild_settings.get(guild.id if guild else None)
+
+
+async def resolve_member(guild, user_id):
+    """A guild member from the cache, falling back to the API; None if gone"""
+    member = guild.get_member(user_id)
+    if member is not None:
+        return member
+    try:
+        return await guild.fetch_member(user_id)
+    except discord.NotFound:
+        return None
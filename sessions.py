@@ -0,0 +1,164 @@
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import database
+
+
+@dataclass
+class VerificationSession:
+    """State of one in-flight verification questionnaire"""
+    user_id: int
+    guild_id: int
+    account_age_days: int
+    deadline: float
+    stage: int = 0
+    answers: List[str] = field(default_factory=list)
+    channel_id: Optional[int] = None
+    created_at: float = field(default_factory=time.time)
+
+
+class SessionStore:
+    """SQLite-backed store of verification sessions keyed by user id.
+
+    Every applicant costs one row instead of a parked coroutine, and sessions
+    survive bot restarts.
+    """
+
+    def __init__(self, path=database.DB_PATH):
+        self.conn = database.connect(path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS verification_sessions (
+                user_id INTEGER PRIMARY KEY,
+                guild_id INTEGER NOT NULL,
+                channel_id INTEGER,
+                stage INTEGER NOT NULL,
+                answers TEXT NOT NULL,
+                account_age_days INTEGER NOT NULL,
+                deadline REAL NOT NULL,
+                created_at REAL NOT NULL
+            )""")
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_sessions_deadline "
+            "ON verification_sessions (deadline)")
+        self.conn.commit()
+
+    @staticmethod
+    def _from_row(row):
+        return VerificationSession(user_id=row['user_id'],
+                                   guild_id=row['guild_id'],
+                                   channel_id=row['channel_id'],
+                                   stage=row['stage'],
+                                   answers=json.loads(row['answers']),
+                                   account_age_days=row['account_age_days'],
+                                   deadline=row['deadline'],
+                                   created_at=row['created_at'])
+
+    def get(self, user_id):
+        """Return the session for a user, or None"""
+        row = self.conn.execute(
+            "SELECT * FROM verification_sessions WHERE user_id = ?",
+            (user_id, )).fetchone()
+        return self._from_row(row) if row else None
+
+    def save(self, session):
+        """Insert or replace a session"""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO verification_sessions "
+            "(user_id, guild_id, channel_id, stage, answers, account_age_days, deadline, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (session.user_id, session.guild_id, session.channel_id,
+             session.stage, json.dumps(session.answers),
+             session.account_age_days, session.deadline, session.created_at))
+        self.conn.commit()
+
+    def delete(self, user_id):
+        """Remove a session; returns True if one existed"""
+        cursor = self.conn.execute(
+            "DELETE FROM verification_sessions WHERE user_id = ?",
+            (user_id, ))
+        self.conn.commit()
+        return cursor.rowcount > 0
+
+    def pop_expired(self, now=None):
+        """Remove and return all sessions whose deadline has passed"""
+        now = time.time() if now is None else now
+        rows = self.conn.execute(
+            "SELECT * FROM verification_sessions WHERE deadline < ?",
+            (now, )).fetchall()
+        if rows:
+            self.conn.execute(
+                "DELETE FROM verification_sessions WHERE deadline < ?",
+                (now, ))
+            self.conn.commit()
+        return [self._from_row(row) for row in rows]
+
+    def routes(self):
+        """(user_id, channel_id) pairs of every stored session"""
+        return [(row['user_id'], row['channel_id'])
+                for row in self.conn.execute(
+                    "SELECT user_id, channel_id FROM verification_sessions")]
+
+
+class SessionAdmission:
+    """Caps how many verification sessions run at once.
+
+    Slot holders are tracked in memory, so admission and duplicate checks
+    are set/dict lookups. Users who click while every slot is taken wait in
+    FIFO order with a start callback, and are admitted as slots free up.
+    """
+
+    def __init__(self, limit, active=()):
+        self.limit = limit
+        self._active = set(active)
+        self._waiting = OrderedDict()
+
+    def __len__(self):
+        return len(self._active)
+
+    @property
+    def waiting(self):
+        return len(self._waiting)
+
+    def is_active(self, user_id):
+        return user_id in self._active
+
+    def position(self, user_id):
+        """1-based place in line, or None if the user isn't waiting"""
+        if user_id not in self._waiting:
+            return None
+        for position, waiting_user_id in enumerate(self._waiting, start=1):
+            if waiting_user_id == user_id:
+                return position
+
+    def try_acquire(self, user_id):
+        """Take a slot if one is free and nobody is queued ahead"""
+        if self._waiting or len(self._active) >= self.limit:
+            return False
+        self._active.add(user_id)
+        return True
+
+    def enqueue(self, user_id, start):
+        """Queue a user; start() is scheduled once they hold a slot"""
+        self._waiting[user_id] = start
+        return len(self._waiting)
+
+    def release(self, user_id):
+        """Free a user's slot; returns [(user_id, start)] of those admitted"""
+        self._active.discard(user_id)
+        return self._admit()
+
+    def set_limit(self, limit):
+        """Change the cap; returns [(user_id, start)] of those admitted"""
+        self.limit = limit
+        return self._admit()
+
+    def _admit(self):
+        admitted = []
+        while self._waiting and len(self._active) < self.limit:
+            user_id, start = self._waiting.popitem(last=False)
+            self._active.add(user_id)
+            admitted.append((user_id, start))
+        return admitted
@@ -0,0 +1,69 @@
+"""Routing persistent button clicks, including pre-':' legacy custom_ids"""
+import os
+import re
+import sys
+import types
+import unittest
+
+import discord
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from component_router import (ComponentRouter, ComponentRoutes,  # noqa: E402
+                              MalformedCustomId, snowflake)
+
+
+class TestRouting(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.calls = []
+        routes = ComponentRoutes()
+
+        @routes.component("approve", payload=snowflake)
+        async def approve(interaction, user_id):
+            self.calls.append(('approve', user_id))
+
+        @routes.component("nsfw_verify_button")
+        async def verify(interaction):
+            self.calls.append(('verify', ))
+
+        self.router = ComponentRouter()
+        self.items = dict(zip(("approve", "nsfw_verify_button"),
+                              self.router.add_routes(routes)))
+
+    async def click(self, namespace, custom_id):
+        item_class = self.items[namespace]
+        match = re.fullmatch(item_class.__discord_ui_compiled_template__,
+                             custom_id)
+        if match is None:
+            return None
+        interaction = types.SimpleNamespace(data={'custom_id': custom_id})
+        item = await item_class.from_custom_id(
+            interaction, discord.ui.Button(custom_id=custom_id), match)
+        await item.callback(interaction)
+        return item
+
+    async def test_current_id(self):
+        await self.click("approve", ComponentRouter.build("approve", 1234))
+        self.assertEqual(self.calls, [('approve', 1234)])
+
+    async def test_legacy_id(self):
+        # Review messages posted before the ':' separator use approve_<id>
+        await self.click("approve", "approve_1234")
+        self.assertEqual(self.calls, [('approve', 1234)])
+
+    async def test_static_id(self):
+        await self.click("nsfw_verify_button", "nsfw_verify_button")
+        self.assertEqual(self.calls, [('verify', )])
+
+    async def test_other_namespace_does_not_match(self):
+        self.assertIsNone(await self.click("approve", "rqapprove:1234"))
+
+    async def test_malformed_payload(self):
+        with self.assertRaises(MalformedCustomId):
+            await self.click("approve", "approve:abc")
+        self.assertEqual(self.calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,188 @@
+"""/command and !command must send the same message for every fun command"""
+import os
+import random
+import sys
+import types
+import unittest
+
+import discord
+from discord.ext import commands
+from discord.ext.commands.view import StringView
+from discord.utils import MISSING
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fun  # noqa: E402
+
+
+class Namespace:
+    """The parsed slash options, as the command tree hands them over"""
+
+    def __init__(self, **values):
+        self.__dict__.update(values)
+
+    def __iter__(self):
+        return iter(self.__dict__.items())
+
+
+class FakeResponse:
+    """Records send_message() instead of calling the Discord API"""
+
+    def __init__(self):
+        self.sent = []
+
+    def is_done(self):
+        return bool(self.sent)
+
+    async def send_message(self, **kwargs):
+        self.sent.append(kwargs)
+        return types.SimpleNamespace(resource=None)
+
+
+class FakeInteraction(discord.Interaction):
+    """A slash command interaction that never touches the network"""
+
+    # Shadow the real properties so plain attributes can stand in for them
+    client = command = channel_id = response = namespace = None
+
+    def __init__(self, bot, command, user, namespace):
+        self.client = bot
+        self.command = command
+        self.namespace = namespace
+        self.response = FakeResponse()
+        self.user = user
+        self.id = 1
+        self.data = {'type': 1}
+        self.message = None
+        self.channel = None
+        self.channel_id = 1
+        self.guild_id = None
+        self.command_failed = False
+        self._state = bot._connection
+
+    def is_expired(self):
+        return False
+
+    async def original_response(self):
+        return None
+
+
+class PrefixContext(commands.Context):
+    """A real prefix Context that records send() instead of posting"""
+
+    async def send(self, content=None, **kwargs):
+        self.sent.append(dict(kwargs, content=content))
+
+
+def payload(kwargs):
+    """What the user sees: content, embed and component layout"""
+    embed = kwargs.get('embed', MISSING)
+    view = kwargs.get('view', MISSING)
+    return {
+        'content': kwargs.get('content'),
+        'embed': None if embed in (None, MISSING) else embed.to_dict(),
+        'view': None if view in (None, MISSING) else view.to_components(),
+    }
+
+
+class TestSlashAndPrefixMatch(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.bot = commands.Bot(command_prefix='!',
+                                intents=discord.Intents.none())
+        await self.bot.add_cog(fun.Fun(self.bot))
+        self.guild = discord.Guild(data={'id': 5, 'name': 'guild'},
+                                   state=self.bot._connection)
+        self.author = self.member(100000000000001001)
+        self.target = self.member(100000000000001002)
+
+    def member(self, user_id):
+        member = discord.Member(data={
+            'user': {'id': user_id, 'username': f'user{user_id}',
+                     'discriminator': '0', 'avatar': None},
+            'roles': [], 'joined_at': None, 'flags': 0
+        }, guild=self.guild, state=self.bot._connection)
+        self.guild._add_member(member)
+        return member
+
+    async def slash(self, name, seed, **options):
+        """Run /name through the hybrid command's app command path"""
+        command = self.bot.get_command(name).app_command
+        namespace = Namespace(**options)
+        interaction = FakeInteraction(self.bot, command, self.author, namespace)
+        random.seed(seed)
+        await command._invoke_with_namespace(interaction, namespace)
+        self.assertFalse(interaction.command_failed)
+        return [payload(sent) for sent in interaction.response.sent]
+
+    async def prefix(self, name, seed, arguments=''):
+        """Run !name arguments through the prefix command path"""
+        command = self.bot.get_command(name)
+        message = types.SimpleNamespace(author=self.author, guild=self.guild,
+                                        channel=None, attachments=[],
+                                        content=f"!{name} {arguments}",
+                                        _state=self.bot._connection)
+        ctx = PrefixContext(message=message, bot=self.bot, prefix='!',
+                            view=StringView(arguments), invoked_with=name,
+                            command=command)
+        ctx.sent = []
+        random.seed(seed)
+        await command.invoke(ctx)
+        return [payload(sent) for sent in ctx.sent]
+
+    async def assert_same(self, name, arguments='', **options):
+        for seed in range(20):
+            with self.subTest(command=name, seed=seed):
+                slash = await self.slash(name, seed, **options)
+                prefix = await self.prefix(name, seed, arguments)
+                self.assertEqual(len(slash), 1)
+                self.assertEqual(slash, prefix)
+
+    async def test_vibecheck(self):
+        await self.assert_same('vibecheck')
+
+    async def test_say(self):
+        await self.assert_same('say', "hello there", message="hello there")
+
+    async def test_hornymeter(self):
+        await self.assert_same('hornymeter')
+
+    async def test_moanbattle(self):
+        await self.assert_same('moanbattle', self.target.mention,
+                               user=self.target)
+
+    async def test_simpfor(self):
+        await self.assert_same('simpfor', self.target.mention, user=self.target)
+
+    async def test_sexbattle(self):
+        await self.assert_same('sexbattle', self.target.mention,
+                               user=self.target)
+
+    async def test_nr(self):
+        await self.assert_same('nr')
+
+
+class TestRenderers(unittest.TestCase):
+
+    def member(self, user_id):
+        return types.SimpleNamespace(
+            mention=f"<@{user_id}>",
+            display_avatar=types.SimpleNamespace(
+                url=f"https://cdn.discordapp.com/embed/avatars/{user_id % 5}.png"))
+
+    def test_battle_mentions_both_members(self):
+        random.seed(0)
+        embed = fun.render_moanbattle(self.member(1), self.member(2))['embed']
+        self.assertIn("**Final Outcome:**", embed.description)
+        self.assertIn(embed.image.url, fun.content.moan_battle.images)
+
+    def test_nr_level_within_range(self):
+        for seed in range(50):
+            random.seed(seed)
+            embed = fun.render_nr(self.member(1))['embed']
+            level = int(embed.fields[0].value.strip('*%'))
+            self.assertTrue(1 <= level <= 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
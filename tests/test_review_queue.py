@@ -0,0 +1,59 @@
+"""Claiming review requests from the per-request Approve/Reject buttons"""
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from review_queue import ReviewQueue  # noqa: E402
+
+GUILD_ID = 5
+
+
+class TestClaimUser(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.queue = ReviewQueue(os.path.join(directory.name, 'bot.db'))
+        self.addCleanup(self.queue.conn.close)
+
+    def add(self, user_id):
+        return self.queue.add(GUILD_ID, user_id, ['name', '30', 'Yes', 'Yes'],
+                              100, 'https://example.com/id.png')
+
+    def test_claims_pending_requests(self):
+        request = self.add(11)
+        self.assertEqual(self.queue.claim_user(GUILD_ID, 11, 'approved'),
+                         [request.id])
+        self.assertEqual(self.queue.get(request.id).status, 'approved')
+
+    def test_second_decision_is_refused(self):
+        self.add(11)
+        self.queue.claim_user(GUILD_ID, 11, 'approved')
+        self.assertIsNone(self.queue.claim_user(GUILD_ID, 11, 'rejected'))
+
+    def test_request_decided_elsewhere_is_refused(self):
+        # e.g. by a bulk decision or the review pager
+        request = self.add(11)
+        self.queue.resolve(request.id, 'rejected')
+        self.assertIsNone(self.queue.claim_user(GUILD_ID, 11, 'approved'))
+
+    def test_message_older_than_the_queue_has_nothing_to_claim(self):
+        # A legacy approve_<id> message has no row; it must still be decidable
+        self.add(12)
+        self.assertEqual(self.queue.claim_user(GUILD_ID, 11, 'approved'), [])
+        self.assertEqual(self.queue.claim_user(GUILD_ID + 1, 12, 'approved'), [])
+
+    def test_reopen_after_failed_decision(self):
+        request = self.add(11)
+        request_ids = self.queue.claim_user(GUILD_ID, 11, 'approved')
+        self.queue.reopen(*request_ids)
+        self.assertEqual(self.queue.get(request.id).status, 'pending')
+        self.assertEqual(self.queue.claim_user(GUILD_ID, 11, 'approved'),
+                         [request.id])
+
+
+if __name__ == "__main__":
+    unittest.main()
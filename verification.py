@@ -0,0 +1,677 @@
+import asyncio
+import logging
+import time
+
+import discord
+from discord import app_commands
+from discord.ext import commands, tasks
+from discord.ui import View
+
+from bot_metrics import SESSION_TIMEOUTS, STAGE_SECONDS
+from component_router import ComponentRoutes
+from deferral import DEFER_REPLY, AutoDefer, auto_defer, respond, send_modal
+from dm_outbox import PRIORITY_CHATTER, PRIORITY_QUESTIONNAIRE
+from review_queue import NO_SCREENSHOT
+from screenshots import (MAX_SCREENSHOT_BYTES, ScreenshotBusy, ScreenshotError,
+                         ScreenshotTooLarge)
+from services import (bot, component_router, dm_outbox, dm_router,
+                      guild_settings, handler_profiler, member_profiles,
+                      open_modals, resolve_member, review_queue,
+                      screenshot_pipeline, session_admission, session_store,
+                      settings_for)
+from sessions import VerificationSession
+
+logger = logging.getLogger(__name__)
+
+# Registered with component_router when the cog loads
+components = ComponentRoutes()
+
+verify_button_id = "nsfw_verify_button"
+
+
+async def create_verification_embed(guild):
+    """Create the verification embed and view"""
+    settings = settings_for(guild)
+    embed = discord.Embed(
+        title="🔞 NSFW Verification Required",
+        description=
+        "To access NSFW sections, click the button below to verify your age and consent.\n\n"
+        "**Requirements:**\n"
+        f"• Account must be at least {settings.min_account_age_days} days old\n"
+        "• Must be 18+ years old\n"
+        "• Age verification screenshot (optional)",
+        color=0xff69b4)
+    embed.set_footer(
+        text="This verification process is required for legal compliance.")
+
+    view = View(timeout=None)  # Persistent view
+    view.add_item(
+        component_router.button(verify_button_id,
+                                label="🔞 Verify Me",
+                                style=discord.ButtonStyle.primary))
+
+    return embed, view
+
+
+QUESTION_TIMEOUT = 300  # 5 minutes per question
+
+
+SCREENSHOT_TIMEOUT = 600  # 10 minutes for upload
+
+
+VERIFICATION_QUESTIONS = [
+    "**1.** What is your Discord username and ID? (You can copy this: `{name}`#{discriminator})",
+    "**2.** How old are you? (Must be 18 or older)",
+    "**3.** Do you consent to seeing NSFW content? (Type 'Yes' or 'No')",
+    "**4.** Have you read and agreed to the server's NSFW rules? (Type 'Yes' or 'No')"
+]
+
+
+STAGE_SCREENSHOT = len(VERIFICATION_QUESTIONS)
+
+
+STAGE_NAMES = ['username', 'age', 'consent', 'rules', 'screenshot']
+
+
+SCREENSHOT_PROMPT = (
+    "**5.** Please upload a screenshot showing your age verification, or type 'skip' to proceed without one.\n"
+    "This could be:\n"
+    "• Government ID (blur out sensitive info, keep age/DOB visible)\n"
+    "• Birth certificate (blur sensitive info)\n"
+    "• Any official document showing your date of birth\n\n"
+    "**Important:** Blur out all personal information except your age/date of birth.\n"
+    "**Note:** You can type 'skip' if you prefer not to upload a screenshot.")
+
+
+@components.component(verify_button_id)
+@auto_defer(DEFER_REPLY)
+async def handle_verification_start(interaction):
+    """Handle the initial verification button click"""
+    user = interaction.user
+    settings = settings_for(interaction.guild)
+
+    # Anti-alt check, from the profile built when the member joined
+    account_age_days = member_profiles.get_or_load(interaction.guild.id,
+                                                   user).account_age_days()
+    if account_age_days < settings.min_account_age_days:
+        await respond(
+            interaction,
+            f"❌ Your account is too new to verify. Account must be at least {settings.min_account_age_days} days old.\n"
+            f"Your account age: {account_age_days} days",
+            ephemeral=True)
+        logger.info(
+            f"Verification denied for {user} - account too new ({account_age_days} days)"
+        )
+        return
+
+    # One session per user: repeat clicks resume it instead of starting over
+    session = session_store.get(user.id)
+    if session is not None:
+        if time.time() <= session.deadline:
+            await resume_session(interaction, session)
+            return
+        end_session(session)
+    if await reply_if_already_started(interaction):
+        return
+
+    if settings.questionnaire_mode == 'modal':
+        # Spam-clicking replaces the open form rather than stacking them
+        previous = open_modals.pop(user.id, None)
+        if previous is not None:
+            previous.stop()
+        modal = open_modals[user.id] = VerificationModal(user, account_age_days)
+        if not await send_modal(interaction, modal):
+            # A deferred interaction can no longer open a form
+            modal.stop()
+            await respond(
+                interaction,
+                "⌛ That took longer than expected. Please click **Verify** again to open the form.",
+                ephemeral=True)
+        return
+
+    if not session_admission.try_acquire(user.id):
+        position = session_admission.enqueue(
+            user.id, lambda: start_when_admitted(
+                user, start_questionnaire(user, interaction.guild.id,
+                                          account_age_days)))
+        await respond(
+            interaction,
+            f"⏳ Lots of people are verifying right now. You're **#{position}** in line; "
+            "I'll DM you the verification form when it's your turn.",
+            ephemeral=True)
+        logger.info(f"Verification for {user} queued at position {position}")
+        return
+
+    try:
+        # Send initial response
+        await respond(
+            interaction,
+            "✅ I've sent you a DM with the verification form. Please check your direct messages.",
+            ephemeral=True)
+    except Exception:
+        # No session holds the slot yet, so nothing else would free it
+        release_session_slot(user.id)
+        raise
+    try:
+        await start_questionnaire(user, interaction.guild.id, account_age_days)
+    except discord.Forbidden:
+        await respond(
+            interaction,
+            "❌ I couldn't send you a DM. Please:\n"
+            "1. Enable DMs from server members\n"
+            "2. Make sure you haven't blocked the bot\n"
+            "3. Try again after adjusting your privacy settings",
+            ephemeral=True)
+        logger.info(f"Could not DM {user} for verification")
+
+
+async def reply_if_already_started(interaction):
+    """Tell a user who already holds or is waiting for a slot; True if so"""
+    user_id = interaction.user.id
+    if session_admission.is_active(user_id):
+        await respond(
+            interaction,
+            "⏳ Your verification is already starting. Please check your direct messages.",
+            ephemeral=True)
+        return True
+    position = session_admission.position(user_id)
+    if position is not None:
+        await respond(
+            interaction,
+            f"⏳ You're already in line for verification (**#{position}**). "
+            "I'll DM you when it's your turn.",
+            ephemeral=True)
+        return True
+    return False
+
+
+def current_prompt(session, user):
+    """The question (or screenshot request) a session is waiting on"""
+    if session.stage < STAGE_SCREENSHOT:
+        return VERIFICATION_QUESTIONS[session.stage].format(
+            name=user.name, discriminator=user.discriminator)
+    return SCREENSHOT_PROMPT
+
+
+async def resume_session(interaction, session):
+    """Re-send the pending prompt of a session the user already has"""
+    user = interaction.user
+    await respond(
+        interaction,
+        "🔁 You already have a verification in progress. I've re-sent your current question in DMs.",
+        ephemeral=True)
+    dm_outbox.post(user, current_prompt(session, user), PRIORITY_QUESTIONNAIRE)
+    logger.info(f"Resumed verification session for {user} at step {session.stage + 1}")
+
+
+async def start_questionnaire(user, guild_id, account_age_days):
+    """Open the DM questionnaire for a user holding a session slot"""
+    try:
+        # The intro and first question are coalesced into one DM by the outbox
+        dm_outbox.post(
+            user, "🔞 **NSFW Verification Process**\n\n"
+            "Hello! Let's get you verified for NSFW content access.\n"
+            "Please answer the following questions honestly and completely.\n"
+            "⏰ You have 5 minutes to complete each step.\n\n"
+            "**Let's begin:**", PRIORITY_QUESTIONNAIRE)
+        first_question = await dm_outbox.send(
+            user,
+            VERIFICATION_QUESTIONS[0].format(name=user.name,
+                                             discriminator=user.discriminator))
+    except Exception:
+        release_session_slot(user.id)
+        raise
+
+    # From here on the session advances from on_message, one DM at a time
+    session_store.save(
+        VerificationSession(user_id=user.id,
+                            guild_id=guild_id,
+                            channel_id=first_question.channel.id,
+                            account_age_days=account_age_days,
+                            deadline=time.time() + QUESTION_TIMEOUT))
+    dm_router.register(user.id, first_question.channel.id, on_session_message)
+    logger.info(f"Verification session started for {user}")
+
+
+async def start_screenshot_step(user, guild_id, account_age_days, answers):
+    """Open a session at the screenshot step for a submitted form"""
+    try:
+        prompt = await dm_outbox.send(user, SCREENSHOT_PROMPT)
+    except Exception:
+        release_session_slot(user.id)
+        raise
+
+    session_store.save(
+        VerificationSession(user_id=user.id,
+                            guild_id=guild_id,
+                            channel_id=prompt.channel.id,
+                            account_age_days=account_age_days,
+                            deadline=time.time() + SCREENSHOT_TIMEOUT,
+                            stage=STAGE_SCREENSHOT,
+                            answers=answers))
+    dm_router.register(user.id, prompt.channel.id, on_session_message)
+    logger.info(f"Verification form submitted by {user}")
+
+
+async def start_when_admitted(user, start):
+    """Run a queued user's session start once they get a slot"""
+    try:
+        dm_outbox.post(user, "✅ It's your turn! Let's get you verified.",
+                       PRIORITY_QUESTIONNAIRE)
+        await start
+    except discord.Forbidden:
+        logger.info(f"Could not DM {user} when their verification slot opened")
+    except Exception as e:
+        logger.error(f"Error starting queued verification for {user}: {e}")
+
+
+def release_session_slot(user_id):
+    """Free a user's session slot and start whoever is next in line"""
+    for _, start in session_admission.release(user_id):
+        asyncio.create_task(start())
+
+
+class VerificationModal(discord.ui.Modal, title="🔞 NSFW Verification"):
+    """The DM questionnaire as a single form; only the screenshot stays in DM"""
+
+    username = discord.ui.TextInput(label="Discord username and ID",
+                                    max_length=100)
+    age = discord.ui.TextInput(label="How old are you?",
+                               placeholder="Must be 18 or older",
+                               max_length=3)
+    consent = discord.ui.TextInput(label="Do you consent to seeing NSFW content?",
+                                   placeholder="Yes or No",
+                                   max_length=3)
+    rules = discord.ui.TextInput(label="Have you read and agreed to the NSFW rules?",
+                                 placeholder="Yes or No",
+                                 max_length=3)
+
+    def __init__(self, user, account_age_days):
+        super().__init__(timeout=QUESTION_TIMEOUT)
+        self.user = user
+        self.account_age_days = account_age_days
+        self.opened_at = time.time()
+        self.username.default = f"{user.name} ({user.id})"
+
+    def _forget(self):
+        if open_modals.get(self.user.id) is self:
+            del open_modals[self.user.id]
+
+    def stop(self):
+        self._forget()
+        super().stop()
+
+    async def on_timeout(self):
+        self._forget()
+
+    async def on_submit(self, interaction):
+        self.stop()
+        STAGE_SECONDS.observe(time.time() - self.opened_at, stage='form')
+        async with AutoDefer(interaction, DEFER_REPLY, name='verification_form'):
+            await self.process(interaction)
+
+    async def process(self, interaction):
+        user = interaction.user
+        answers = [
+            field.value.strip()
+            for field in (self.username, self.age, self.consent, self.rules)
+        ]
+        for question_number, answer in enumerate(answers, start=1):
+            rejection = check_answer(question_number, answer)
+            if rejection is not None:
+                reply, reason = rejection
+                await respond(interaction, reply, ephemeral=True)
+                logger.info(f"Verification cancelled for {user} - {reason}")
+                return
+
+        # The form may have been open while another session started
+        session = session_store.get(user.id)
+        if session is not None and time.time() <= session.deadline:
+            await resume_session(interaction, session)
+            return
+        if await reply_if_already_started(interaction):
+            return
+
+        guild_id = interaction.guild.id
+        if not session_admission.try_acquire(user.id):
+            position = session_admission.enqueue(
+                user.id, lambda: start_when_admitted(
+                    user, start_screenshot_step(user, guild_id,
+                                                self.account_age_days, answers)))
+            await respond(
+                interaction,
+                f"✅ Answers recorded. Lots of people are verifying right now; you're **#{position}** in line "
+                "and I'll DM you for the last step when it's your turn.",
+                ephemeral=True)
+            logger.info(f"Verification form from {user} queued at position {position}")
+            return
+
+        try:
+            await respond(
+                interaction,
+                "✅ Answers recorded. I've sent you a DM for the last step.",
+                ephemeral=True)
+        except Exception:
+            release_session_slot(user.id)
+            raise
+        try:
+            await start_screenshot_step(user, guild_id, self.account_age_days,
+                                        answers)
+        except discord.Forbidden:
+            await respond(
+                interaction,
+                "❌ I couldn't send you a DM. Please enable DMs from server members and try again.",
+                ephemeral=True)
+            logger.info(f"Could not DM {user} for verification")
+
+    async def on_error(self, interaction, error):
+        logger.error(f"Error in verification form for {interaction.user}: {error}")
+        await respond(
+            interaction,
+            "❌ An error occurred during verification. Please try again or contact an administrator.",
+            ephemeral=True)
+
+
+def observe_stage(session):
+    """Record how long the applicant took on the session's current step"""
+    timeout = SCREENSHOT_TIMEOUT if session.stage >= STAGE_SCREENSHOT else QUESTION_TIMEOUT
+    STAGE_SECONDS.observe(time.time() - (session.deadline - timeout),
+                          stage=STAGE_NAMES[session.stage])
+
+
+def end_session(session):
+    """Drop a session and stop routing its DMs"""
+    session_store.delete(session.user_id)
+    dm_router.unregister(session.user_id, session.channel_id)
+    release_session_slot(session.user_id)
+
+
+async def on_session_message(message):
+    """Advance the sender's verification session"""
+    user = message.author
+    session = session_store.get(user.id)
+    if session is None:
+        dm_router.unregister(user.id, message.channel.id)
+        return
+
+    try:
+        if time.time() > session.deadline:
+            end_session(session)
+            await notify_session_timeout(user, session)
+        elif session.stage < STAGE_SCREENSHOT:
+            await advance_questionnaire(session, message)
+        else:
+            await receive_screenshot(session, message)
+    except discord.Forbidden:
+        end_session(session)
+        logger.info(f"Could not DM {user} during verification")
+    except Exception as e:
+        end_session(session)
+        logger.error(f"Error in verification process for {user}: {e}")
+        dm_outbox.post(
+            user,
+            "❌ An error occurred during verification. Please try again or contact an administrator.",
+            PRIORITY_QUESTIONNAIRE)
+
+
+def check_answer(question_number, answer):
+    """Validate a questionnaire answer.
+
+    Returns None if it is acceptable, else (message for the user, reason to log).
+    """
+    if question_number == 2:  # Age question
+        try:
+            age = int(answer)
+        except ValueError:
+            return ("❌ Please provide a valid age number. Verification cancelled.",
+                    "invalid age format")
+        if age < 18:
+            return ("❌ You must be 18 or older to access NSFW content. Verification cancelled.",
+                    f"under 18 (claimed age: {age})")
+    elif question_number in [3, 4]:  # Consent questions
+        if answer.lower() not in ['yes', 'y']:
+            return ("❌ You must consent and agree to the rules to access NSFW content. Verification cancelled.",
+                    "did not consent/agree")
+    return None
+
+
+async def advance_questionnaire(session, message):
+    """Record one text answer and ask the next question"""
+    user = message.author
+    answer = message.content.strip()
+    if not answer:
+        return
+
+    # Validate critical answers
+    rejection = check_answer(session.stage + 1, answer)
+    if rejection is not None:
+        reply, reason = rejection
+        end_session(session)
+        dm_outbox.post(user, reply, PRIORITY_QUESTIONNAIRE)
+        logger.info(f"Verification cancelled for {user} - {reason}")
+        return
+
+    # Persist before any await so a second DM can't replay this step
+    observe_stage(session)
+    session.answers.append(answer)
+    session.stage += 1
+    if session.stage < STAGE_SCREENSHOT:
+        session.deadline = time.time() + QUESTION_TIMEOUT
+        next_prompt = VERIFICATION_QUESTIONS[session.stage]
+    else:
+        session.deadline = time.time() + SCREENSHOT_TIMEOUT
+        next_prompt = SCREENSHOT_PROMPT
+    session_store.save(session)
+
+    # The ack and next prompt go out as one DM
+    dm_outbox.post(user, "✅ Answer recorded.", PRIORITY_CHATTER)
+    await dm_outbox.send(user, next_prompt)
+
+
+async def receive_screenshot(session, message):
+    """Accept the screenshot (or a skip) and submit the request for review"""
+    user = message.author
+    if message.content.strip().lower() in ['skip', 's']:
+        image_url = NO_SCREENSHOT
+        confirmation = "✅ Screenshot skipped. Proceeding with verification."
+    elif len(message.attachments) > 0:
+        image_url = message.attachments[0].url
+        confirmation = "✅ Screenshot received."
+    else:
+        return
+
+    duplicate_of = []
+    if image_url != NO_SCREENSHOT:
+        # Stop routing DMs while the screenshot is checked so a second upload
+        # can't submit twice; the session keeps its slot until it is done
+        dm_router.unregister(user.id, session.channel_id)
+        try:
+            screenshot = await screenshot_pipeline.check(
+                message.attachments[0],
+                session.guild_id,
+                user.id,
+                on_wait=lambda: dm_outbox.post(
+                    user, "⏳ We're processing a lot of screenshots right now. "
+                    "Hold on, yours is next in line.", PRIORITY_QUESTIONNAIRE))
+            duplicate_of = [match.user_id for match in screenshot.matches]
+        except ScreenshotTooLarge:
+            dm_router.register(user.id, session.channel_id, on_session_message)
+            dm_outbox.post(
+                user,
+                f"❌ That file is too large. Please upload a screenshot under "
+                f"{MAX_SCREENSHOT_BYTES // (1024 * 1024)} MB.",
+                PRIORITY_QUESTIONNAIRE)
+            return
+        except ScreenshotBusy:
+            dm_router.register(user.id, session.channel_id, on_session_message)
+            dm_outbox.post(
+                user,
+                "⏳ Too many screenshots are being processed right now. "
+                "Please send yours again in a minute.", PRIORITY_QUESTIONNAIRE)
+            logger.warning(f"Screenshot queue full, asked {user} to retry")
+            return
+        except ScreenshotError as e:
+            # Still send it for review, just without the duplicate check
+            logger.warning(f"Could not check screenshot from {user}: {e}")
+
+    observe_stage(session)
+    end_session(session)
+    dm_outbox.post(user, confirmation, PRIORITY_CHATTER)
+    await submit_verification(session, user, image_url, duplicate_of)
+
+
+async def notify_session_timeout(user, session):
+    """Tell the user their session expired"""
+    SESSION_TIMEOUTS.inc(stage=STAGE_NAMES[session.stage])
+    if session.stage < STAGE_SCREENSHOT:
+        dm_outbox.post(
+            user,
+            "⏰ Verification timed out. Please start over by clicking the verification button again.",
+            PRIORITY_CHATTER)
+        logger.info(
+            f"Verification timed out for {user} at question {session.stage + 1}")
+    else:
+        dm_outbox.post(
+            user,
+            "⏰ Image upload timed out. Please start over by clicking the verification button again.",
+            PRIORITY_CHATTER)
+        logger.info(f"Image upload timed out for {user}")
+
+
+@tasks.loop(seconds=30)
+async def expire_sessions():
+    """Expire sessions whose current step ran past its deadline"""
+    for session in session_store.pop_expired():
+        dm_router.unregister(session.user_id, session.channel_id)
+        release_session_slot(session.user_id)
+        try:
+            user = bot.get_user(session.user_id) or await bot.fetch_user(
+                session.user_id)
+            await notify_session_timeout(user, session)
+        except discord.HTTPException as e:
+            logger.info(
+                f"Could not notify user {session.user_id} of timeout: {e}")
+
+
+async def submit_verification(session, user, image_url, duplicate_of=()):
+    """Queue a completed questionnaire for review"""
+    # Send to review channel
+    settings = guild_settings.get(session.guild_id)
+    if settings.review_channel_id is None:
+        dm_outbox.post(
+            user,
+            "❌ Bot configuration error. Please contact an administrator.",
+            PRIORITY_QUESTIONNAIRE)
+        logger.error("Review channel ID not configured properly")
+        return
+
+    guild = bot.get_guild(session.guild_id)
+    vr_channel = settings.review_channel(guild)
+    if vr_channel is None:
+        dm_outbox.post(
+            user,
+            "❌ Review channel not found. Please contact an administrator.",
+            PRIORITY_QUESTIONNAIRE)
+        logger.error(
+            f"Review channel {settings.review_channel_id} not found or bot lacks access"
+        )
+        return
+
+    profile = member_profiles.get(guild.id, user.id)
+    if profile is None:
+        member = await resolve_member(guild, user.id)
+        profile = member_profiles.load(guild.id, member or user)
+
+    request = review_queue.add(session.guild_id, user.id, session.answers,
+                               session.account_age_days, image_url,
+                               duplicate_of, profile.alt_score)
+
+    # The moderation extension puts it in front of moderators
+    bot.dispatch('verification_submitted', request)
+
+    dm_outbox.post(
+        user, "✅ **Verification submitted successfully!**\n\n"
+        "Your verification request has been sent to the moderation team for review.\n"
+        "You will receive a DM with the result once it's processed.\n\n"
+        "Thank you for your patience! 🙏", PRIORITY_QUESTIONNAIRE)
+
+    logger.info(f"Verification request submitted for {user}")
+
+
+class Verification(commands.Cog):
+    """The applicant side: verify button, DM questionnaire and screenshot"""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    async def cog_load(self):
+        self.bot.add_dynamic_items(*component_router.add_routes(components))
+        # Sessions outlive a reload; route their DMs to this module's handler
+        for user_id, channel_id in session_store.routes():
+            dm_router.register(user_id, channel_id, on_session_message)
+        logger.info(f'Resuming {len(dm_router)} verification sessions')
+        expire_sessions.start()
+
+    async def cog_unload(self):
+        task = expire_sessions.get_task()
+        expire_sessions.cancel()
+        if task is not None:
+            # Let it finish, so a reload that rolls back can start it again
+            await asyncio.wait([task])
+        self.bot.remove_dynamic_items(
+            *component_router.remove_routes(components))
+
+    @commands.command()
+    async def postverify(self, ctx):
+        """Post the NSFW verification embed with button (prefix command)"""
+        try:
+            embed, view = await create_verification_embed(ctx.guild)
+            await ctx.send(embed=embed, view=view)
+            logger.info(
+                f"Verification embed posted by {ctx.author} in {ctx.channel} (prefix command)"
+            )
+
+        except Exception as e:
+            logger.error(f"Error posting verification embed: {e}")
+            await ctx.send(
+                "An error occurred while posting the verification embed.")
+
+    @app_commands.command(name="postverify",
+                          description="Post the NSFW verification embed with button")
+    @discord.app_commands.describe()
+    async def slash_postverify(self, interaction: discord.Interaction):
+        """Post the NSFW verification embed with button (slash command)"""
+        try:
+            embed, view = await create_verification_embed(interaction.guild)
+            await interaction.response.send_message(embed=embed, view=view)
+            logger.info(
+                f"Verification embed posted by {interaction.user} in {interaction.channel} (slash command)"
+            )
+
+        except Exception as e:
+            logger.error(f"Error posting verification embed: {e}")
+            await interaction.response.send_message(
+                "An error occurred while posting the verification embed.",
+                ephemeral=True)
+
+    @commands.Cog.listener('on_member_join')
+    async def profile_new_member(self, member):
+        """Score new members ahead of time so the verify button doesn't have to"""
+        profile = member_profiles.load(member.guild.id, member)
+        logger.info(f"{member} joined {member.guild} (alt score {profile.alt_score})")
+
+    @commands.Cog.listener('on_member_remove')
+    async def forget_member(self, member):
+        member_profiles.discard(member.guild.id, member.id)
+
+    @commands.Cog.listener('on_message')
+    async def route_direct_message(self, message):
+        """Hand DMs to the verification session waiting on them"""
+        started = time.perf_counter()
+        if await dm_router.dispatch(message):
+            handler_profiler.observe("dm:verification",
+                                     time.perf_counter() - started)
+
+
+async def setup(bot):
+    await bot.add_cog(Verification(bot))